@@ -1,7 +1,13 @@
 """llmkit — Shared LLM configuration and provider presets."""
 
 from llmkit.config import LLMConfig
-from llmkit.providers import PROVIDERS, ProviderInfo, get_provider, list_providers
+from llmkit.providers import (
+    PROVIDERS,
+    ProviderInfo,
+    get_provider,
+    get_provider_by_api_base,
+    list_providers,
+)
 from llmkit.workspace import resolve_workspace
 
 __all__ = [
@@ -9,6 +15,7 @@ __all__ = [
     "PROVIDERS",
     "ProviderInfo",
     "get_provider",
+    "get_provider_by_api_base",
     "list_providers",
     "resolve_workspace",
 ]
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from llmkit.providers import ProviderInfo, get_provider
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """LLM connection settings."""
 
@@ -18,31 +18,52 @@ class LLMConfig:
     provider: str | None = None
 
     @classmethod
-    def from_env(cls) -> LLMConfig:
-        """Build config from WWA_* environment variables."""
-        provider_name = os.getenv("WWA_PROVIDER")
-        provider = get_provider(provider_name) if provider_name else None
-
-        model = os.getenv("WWA_MODEL")
-        api_base = os.getenv("WWA_API_BASE")
-        api_key = os.getenv("WWA_API_KEY")
-
-        if provider and not model:
-            model = provider.default_model
-        if provider and not api_base:
-            api_base = provider.api_base
-        if provider and not api_key:
-            api_key = os.getenv(provider.env_key)
+    def from_env(
+        cls,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+        api_base: str | None = None,
+        api_key: str | None = None,
+    ) -> LLMConfig:
+        """Build config from WWA_* environment variables.
+
+        Explicit arguments (e.g. CLI flags) take precedence, and the
+        environment is only read for the fields they leave unset. An
+        explicit *provider* replaces WWA_PROVIDER, and its defaults take
+        precedence over WWA_MODEL / WWA_API_BASE.
+        """
+        if provider:
+            info = get_provider(provider)
+            model = model or (info.default_model if info else None)
+            api_base = api_base or (info.api_base if info else None)
+        else:
+            provider = os.getenv("WWA_PROVIDER")
+            info = get_provider(provider) if provider else None
+
+        model = model or os.getenv("WWA_MODEL")
+        api_base = api_base or os.getenv("WWA_API_BASE")
+        api_key = api_key or os.getenv("WWA_API_KEY")
+
+        if info and not model:
+            model = info.default_model
+        if info and not api_base:
+            api_base = info.api_base
+        if info and not api_key:
+            api_key = os.getenv(info.env_key)
 
         return cls(
             model=model or "openai/gpt-4o-mini",
             api_base=api_base,
             api_key=api_key,
-            provider=provider_name,
+            provider=provider,
         )
 
     def to_litellm_kwargs(self) -> dict[str, str]:
-        """Return kwargs suitable for litellm.acompletion()."""
+        """Return kwargs suitable for litellm.acompletion().
+
+        The result is a fresh dict; callers may add request-specific keys.
+        """
         kwargs: dict[str, str] = {"model": self.model}
         if self.api_base:
             kwargs["api_base"] = self.api_base
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
+from urllib.parse import urlsplit
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProviderInfo:
     """Metadata for an LLM provider."""
 
@@ -111,20 +114,43 @@ _ZHIZENGZENG = ProviderInfo(
 
 # --- Registry ---
 
-PROVIDERS: dict[str, ProviderInfo] = {
-    p.name: p
-    for p in [
-        _OPENAI, _GOOGLE, _ANTHROPIC, _GLM, _MINIMAX, _DOUBAO, _DEEPSEEK,
-        _PACKYCODE, _YUNWU, _SILICONFLOW, _OPENROUTER, _ZHIZENGZENG,
-    ]
-}
+_ALL: tuple[ProviderInfo, ...] = (
+    _OPENAI, _GOOGLE, _ANTHROPIC, _GLM, _MINIMAX, _DOUBAO, _DEEPSEEK,
+    _PACKYCODE, _YUNWU, _SILICONFLOW, _OPENROUTER, _ZHIZENGZENG,
+)
+
+# Read-only view; keys are the lowercase provider names.
+PROVIDERS: Mapping[str, ProviderInfo] = MappingProxyType(
+    {p.name.lower(): p for p in _ALL}
+)
+
+# api_base hostname -> provider, for resolving a provider from a base URL.
+_BY_HOST: Mapping[str, ProviderInfo] = MappingProxyType({
+    host: p
+    for p in _ALL
+    if p.api_base and (host := urlsplit(p.api_base).hostname)
+})
 
 
 def get_provider(name: str) -> ProviderInfo | None:
-    """Look up a provider by name (case-insensitive)."""
-    return PROVIDERS.get(name.lower())
+    """Look up a provider by name (case-insensitive).
+
+    Returns the registry's shared ProviderInfo instance, so repeated lookups
+    of one provider yield the identical object.
+    """
+    if not name:
+        return None
+    return PROVIDERS.get(name) or PROVIDERS.get(name.lower())
+
+
+def get_provider_by_api_base(url: str) -> ProviderInfo | None:
+    """Look up the provider whose api_base is served from *url*'s host."""
+    if not url:
+        return None
+    host = urlsplit(url if "://" in url else f"https://{url}").hostname
+    return _BY_HOST.get(host) if host else None
 
 
 def list_providers() -> list[str]:
     """Return all registered provider names."""
-    return list(PROVIDERS.keys())
+    return list(PROVIDERS)
@@ -9,15 +9,28 @@ Replicates the TypeScript resolution logic from:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
+_T = TypeVar("_T")
 
 _LEGACY_STATE_DIRNAMES = (".clawdbot", ".moltbot", ".moldbot")
 _NEW_STATE_DIRNAME = ".openclaw"
+_STATE_DIRNAMES = (_NEW_STATE_DIRNAME, *_LEGACY_STATE_DIRNAMES)
+_STATE_DIRNAME_SET = frozenset(_STATE_DIRNAMES)
 _CONFIG_FILENAME = "openclaw.json"
 _LEGACY_CONFIG_FILENAMES = ("clawdbot.json", "moltbot.json", "moldbot.json")
+_CONFIG_FILENAMES = (_CONFIG_FILENAME, *_LEGACY_CONFIG_FILENAMES)
+_CONFIG_FILENAME_SET = frozenset(_CONFIG_FILENAMES)
 
 # Workspace file constants (mirrors DEFAULT_*_FILENAME in workspace.ts)
 AGENTS_FILENAME = "AGENTS.md"
@@ -43,6 +56,42 @@ __all__ = [
     "resolve_workspace",
 ]
 
+# Environment variables that influence resolution. Cached results are keyed
+# on their values, so changing any of them yields a fresh lookup.
+_ENV_KEYS = (
+    "HOME",
+    "OPENCLAW_HOME",
+    "OPENCLAW_STATE_DIR",
+    "CLAWDBOT_STATE_DIR",
+    "OPENCLAW_CONFIG_PATH",
+    "CLAWDBOT_CONFIG_PATH",
+    "OPENCLAW_PROFILE",
+)
+
+_CACHES: list[Any] = []
+
+
+def _env_cached(func: Callable[[], _T]) -> Callable[[], _T]:
+    """Cache a zero-arg resolver, keyed on the relevant environment variables.
+
+    Filesystem and cwd changes are not observed; call ``_invalidate_caches()`` after
+    creating or removing state directories / config files in-process.
+    """
+    cached = functools.lru_cache(maxsize=1)(lambda _env: func())
+    _CACHES.append(cached)
+
+    @functools.wraps(func)
+    def wrapper() -> _T:
+        return cached(tuple(os.environ.get(k) for k in _ENV_KEYS))
+
+    return wrapper
+
+
+def _invalidate_caches() -> None:
+    """Drop all cached resolution results."""
+    for cached in _CACHES:
+        cached.cache_clear()
+
 
 def _expand_path(raw: str) -> Path:
     """Expand ~ prefix and resolve to absolute path.
@@ -59,6 +108,7 @@ def _expand_path(raw: str) -> Path:
     return p.resolve()
 
 
+@_env_cached
 def _resolve_home() -> Path:
     """Resolve effective home directory, respecting OPENCLAW_HOME.
 
@@ -71,12 +121,25 @@ def _resolve_home() -> Path:
     return Path.home()
 
 
-def _all_state_dirs() -> list[Path]:
-    """Return all candidate state directories (new + legacy), in priority order."""
+@_env_cached
+def _existing_state_dirs() -> tuple[Path, ...]:
+    """Return the existing state directories (new + legacy), in priority order.
+
+    One listing of the home directory replaces a stat() per candidate.
+    """
     home = _resolve_home()
-    return [home / _NEW_STATE_DIRNAME] + [home / d for d in _LEGACY_STATE_DIRNAMES]
+    try:
+        with os.scandir(home) as entries:
+            present = {
+                e.name for e in entries
+                if e.name in _STATE_DIRNAME_SET and e.is_dir()
+            }
+    except OSError:
+        return ()
+    return tuple(home / d for d in _STATE_DIRNAMES if d in present)
 
 
+@_env_cached
 def _resolve_state_dir() -> Path:
     """Resolve OpenClaw state directory.
 
@@ -89,14 +152,15 @@ def _resolve_state_dir() -> Path:
     if override:
         return _expand_path(override)
 
-    for d in _all_state_dirs():
-        if d.exists():
-            return d
+    existing = _existing_state_dirs()
+    if existing:
+        return existing[0]
 
     # Default to new dir even if it doesn't exist yet
-    return _all_state_dirs()[0]
+    return _resolve_home() / _NEW_STATE_DIRNAME
 
 
+@_env_cached
 def _find_config_path() -> Path | None:
     """Find the OpenClaw config file.
 
@@ -112,28 +176,42 @@ def _find_config_path() -> Path | None:
         p = Path(override).expanduser().resolve()
         return p if p.is_file() else None
 
-    # Search all state dirs × all config filenames
-    for state_dir in _all_state_dirs():
-        for filename in (_CONFIG_FILENAME, *_LEGACY_CONFIG_FILENAMES):
-            candidate = state_dir / filename
-            if candidate.is_file():
-                return candidate
+    # Search all state dirs × all config filenames: one directory listing
+    # per existing state dir instead of a stat() per candidate file.
+    for state_dir in _existing_state_dirs():
+        try:
+            with os.scandir(state_dir) as entries:
+                present = {
+                    e.name for e in entries
+                    if e.name in _CONFIG_FILENAME_SET and e.is_file()
+                }
+        except OSError:
+            continue
+        for filename in _CONFIG_FILENAMES:
+            if filename in present:
+                return state_dir / filename
 
     return None
 
 
+@_env_cached
 def _read_config() -> dict[str, Any]:
-    """Read and parse the OpenClaw config file (JSON)."""
+    """Read and parse the OpenClaw config file (JSON).
+
+    The result is cached and shared between callers; do not mutate it.
+    """
     config_path = _find_config_path()
     if not config_path:
         return {}
     try:
-        data = json.loads(config_path.read_text(encoding="utf-8"))
+        # Both parsers take raw UTF-8 bytes, skipping a str decode pass.
+        data = _json_loads(config_path.read_bytes())
         return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):  # JSONDecodeError, bad UTF-8, I/O errors
         return {}
 
 
+@_env_cached
 def resolve_workspace() -> Path:
     """Resolve the OpenClaw agent workspace directory.
 
@@ -0,0 +1,71 @@
+"""Tests for llmkit.config — LLMConfig."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, fields, replace
+
+import pytest
+
+from llmkit.config import LLMConfig
+
+
+class TestToLitellmKwargs:
+    def test_omits_unset_fields(self) -> None:
+        assert LLMConfig(model="m").to_litellm_kwargs() == {"model": "m"}
+
+    def test_returns_independent_copies(self) -> None:
+        cfg = LLMConfig(model="m", api_key="k")
+        kwargs = cfg.to_litellm_kwargs()
+        kwargs["messages"] = []
+        assert cfg.to_litellm_kwargs() == {"model": "m", "api_key": "k"}
+
+    def test_replace_recomputes(self) -> None:
+        cfg = replace(LLMConfig(model="m"), api_base="http://x")
+        assert cfg.to_litellm_kwargs() == {"model": "m", "api_base": "http://x"}
+
+    def test_kwargs_are_not_a_dataclass_field(self) -> None:
+        cfg = LLMConfig(model="m", api_key="secret")
+        assert asdict(cfg) == {
+            "model": "m", "api_base": None, "api_key": "secret", "provider": None,
+        }
+        assert [f.name for f in fields(cfg)] == ["model", "api_base", "api_key", "provider"]
+
+
+class TestFromEnv:
+    _VARS = ("WWA_PROVIDER", "WWA_MODEL", "WWA_API_BASE", "WWA_API_KEY", "GLM_API_KEY")
+
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for var in self._VARS:
+            monkeypatch.delenv(var, raising=False)
+
+    def test_reads_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("WWA_MODEL", "env/model")
+        monkeypatch.setenv("WWA_API_KEY", "env-key")
+        cfg = LLMConfig.from_env()
+        assert (cfg.model, cfg.api_key) == ("env/model", "env-key")
+
+    def test_arguments_override_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("WWA_MODEL", "env/model")
+        monkeypatch.setenv("WWA_API_KEY", "env-key")
+        cfg = LLMConfig.from_env(model="cli/model")
+        assert (cfg.model, cfg.api_key) == ("cli/model", "env-key")
+
+    def test_explicit_provider_replaces_env_provider(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("WWA_PROVIDER", "openai")
+        monkeypatch.setenv("WWA_MODEL", "env/model")
+        monkeypatch.setenv("GLM_API_KEY", "glm-key")
+        cfg = LLMConfig.from_env(provider="glm")
+        assert cfg.provider == "glm"
+        assert cfg.model == "openai/glm-4-flash"
+        assert cfg.api_base == "https://open.bigmodel.cn/api/paas/v4"
+        assert cfg.api_key == "glm-key"
+
+    def test_explicit_values_skip_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("WWA_PROVIDER", "does-not-exist")
+        cfg = LLMConfig.from_env(
+            provider="glm", model="m", api_base="http://x", api_key="k",
+        )
+        assert cfg == LLMConfig(model="m", api_base="http://x", api_key="k", provider="glm")
@@ -0,0 +1,28 @@
+"""Tests for llmkit.providers — provider registry lookups."""
+
+from __future__ import annotations
+
+from llmkit.providers import get_provider, get_provider_by_api_base
+
+
+class TestGetProvider:
+    def test_case_insensitive(self) -> None:
+        assert get_provider("DeepSeek") is get_provider("deepseek")
+
+    def test_unknown_and_empty(self) -> None:
+        assert get_provider("nope") is None
+        assert get_provider("") is None
+
+
+class TestGetProviderByApiBase:
+    def test_matches_api_base_host(self) -> None:
+        provider = get_provider_by_api_base("https://api.deepseek.com/v1")
+        assert provider is get_provider("deepseek")
+
+    def test_ignores_path_and_scheme(self) -> None:
+        provider = get_provider_by_api_base("openrouter.ai/other/path")
+        assert provider is get_provider("openrouter")
+
+    def test_unknown_host(self) -> None:
+        assert get_provider_by_api_base("https://example.com/v1") is None
+        assert get_provider_by_api_base("") is None
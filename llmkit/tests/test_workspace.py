@@ -9,6 +9,7 @@ import pytest
 
 from llmkit.workspace import (
     _find_config_path,
+    _invalidate_caches,
     _read_config,
     _resolve_home,
     _resolve_state_dir,
@@ -28,6 +29,7 @@ def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
         "OPENCLAW_PROFILE",
     ):
         monkeypatch.delenv(key, raising=False)
+    _invalidate_caches()
 
 
 class TestResolveHome:
@@ -170,6 +172,16 @@ class TestReadConfig:
         cfg.write_text('"just a string"', encoding="utf-8")
         assert _read_config() == {}
 
+    def test_invalid_utf8_returns_empty(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path))
+        state = tmp_path / ".openclaw"
+        state.mkdir()
+        cfg = state / "openclaw.json"
+        cfg.write_bytes(b'{"agents": "\xff\xfe"}')
+        assert _read_config() == {}
+
     def test_no_config_returns_empty(
         self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
     ) -> None:
@@ -270,3 +282,26 @@ class TestResolveWorkspace:
             encoding="utf-8",
         )
         assert resolve_workspace() == tmp_path / ".openclaw" / "workspace"
+
+
+class TestCaching:
+    def test_env_change_invalidates(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path / "a"))
+        assert resolve_workspace() == tmp_path / "a" / ".openclaw" / "workspace"
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path / "b"))
+        assert resolve_workspace() == tmp_path / "b" / ".openclaw" / "workspace"
+
+    def test_filesystem_changes_need_invalidation(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setenv("OPENCLAW_HOME", str(tmp_path))
+        assert _find_config_path() is None
+        state = tmp_path / ".openclaw"
+        state.mkdir()
+        cfg = state / "openclaw.json"
+        cfg.write_text("{}", encoding="utf-8")
+        assert _find_config_path() is None
+        _invalidate_caches()
+        assert _find_config_path() == cfg
@@ -0,0 +1,17 @@
+"""Shared fixtures for whoami tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from whoami.utils.http import clear_json_cache, close_client
+
+
+@pytest.fixture(autouse=True)
+async def _isolate_http_state():
+    # fetch_json's response cache and the pooled client are process-wide;
+    # never let one test's responses reach another.
+    clear_json_cache()
+    yield
+    clear_json_cache()
+    await close_client()
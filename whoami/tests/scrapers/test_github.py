@@ -0,0 +1,88 @@
+"""Tests for the GitHub scraper's GraphQL path."""
+
+from __future__ import annotations
+
+import httpx
+
+from whoami.models import ScraperConfig
+from whoami.scrapers.github import GitHubScraper
+
+_USER = {
+    "login": "octocat",
+    "name": "The Octocat",
+    "bio": "hi",
+    "url": "https://github.com/octocat",
+    "followers": {"totalCount": 3},
+    "following": {"totalCount": 1},
+    "repositories": {
+        "totalCount": 1,
+        "nodes": [{
+            "name": "hello",
+            "description": None,
+            "primaryLanguage": {"name": "Python"},
+            "stargazerCount": 5,
+            "forkCount": 0,
+            "url": "https://github.com/octocat/hello",
+        }],
+    },
+}
+
+
+async def _scrape(graphql_reply: dict) -> tuple[list[str], dict[str, list[str]]]:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url.path}")
+        if request.url.path == "/graphql":
+            return httpx.Response(200, json=graphql_reply)
+        if request.url.path == "/users/octocat/orgs":
+            return httpx.Response(200, json=[{"login": "github", "description": "GH"}])
+        return httpx.Response(404, json={})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        config = ScraperConfig(extra={"http_client": client, "github_token": "t"})
+        data = await GitHubScraper().scrape("https://github.com/octocat", config)
+
+    by_category: dict[str, list[str]] = {}
+    for item in data.items:
+        by_category.setdefault(item.category, []).append(item.key)
+    return calls, by_category
+
+
+async def test_complete_graphql_reply_needs_no_rest_calls() -> None:
+    reply = {"data": {"user": {
+        **_USER,
+        "organizations": {"nodes": [{"login": "octo-org", "description": None}]},
+    }}}
+    calls, items = await _scrape(reply)
+
+    assert calls == ["POST /graphql"]
+    assert items["repo"] == ["hello"]
+    assert items["organization"] == ["octo-org"]
+
+
+async def test_partial_graphql_reply_fetches_orgs_over_rest() -> None:
+    # What GitHub sends for a token without read:org.
+    reply = {
+        "data": {"user": {**_USER, "organizations": None}},
+        "errors": [{
+            "type": "INSUFFICIENT_SCOPES",
+            "path": ["user", "organizations"],
+            "message": "Your token has not been granted the required scopes.",
+        }],
+    }
+    calls, items = await _scrape(reply)
+
+    assert calls == ["POST /graphql", "GET /users/octocat/orgs"]
+    assert items["repo"] == ["hello"]
+    assert items["organization"] == ["github"]
+
+
+async def test_failed_graphql_reply_falls_back_to_rest() -> None:
+    calls, _ = await _scrape({"data": {"user": None}, "errors": [{"message": "nope"}]})
+
+    assert calls[0] == "POST /graphql"
+    assert sorted(calls[1:]) == [
+        "GET /users/octocat", "GET /users/octocat/orgs", "GET /users/octocat/repos",
+    ]
+
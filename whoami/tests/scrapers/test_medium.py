@@ -0,0 +1,148 @@
+"""Tests for the streaming Medium RSS reader."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+from lxml import etree
+
+from whoami.models import ScrapedData, ScraperConfig
+from whoami.scrapers.medium import MediumScraper, _FeedReader
+
+_HEAD = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<rss xmlns:dc="http://purl.org/dc/elements/1.1/" version="2.0"><channel>'
+    b"<title>Stories by Ann Lee on Medium</title>"
+)
+_TAIL = b"</channel></rss>"
+
+
+def _item(n: int, creator: bool = True) -> bytes:
+    dc = b"<dc:creator>Ann Lee</dc:creator>" if creator else b""
+    return (
+        b"<item><title>Post %d</title><link>https://medium.com/@ann/%d</link>"
+        b"<category>python</category>%s<pubDate>Mon, 01 Jan 2024</pubDate></item>"
+        % (n, n, dc)
+    )
+
+
+def _feed(count: int) -> bytes:
+    return _HEAD + b"".join(_item(n) for n in range(count)) + _TAIL
+
+
+def _chunks(data: bytes, size: int = 16) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class _ChunkStream(httpx.AsyncByteStream):
+    def __init__(self, data: bytes) -> None:
+        self.chunks = _chunks(data, 64)
+        self.sent = 0
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+
+async def _scrape(body: bytes, max_items: int) -> tuple[ScrapedData, _ChunkStream]:
+    stream = _ChunkStream(body)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url == "https://medium.com/feed/@ann"
+        return httpx.Response(200, stream=stream)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        config = ScraperConfig(max_items=max_items, extra={"http_client": client})
+        data = await MediumScraper().scrape("https://medium.com/@ann", config)
+    return data, stream
+
+
+# ----------------------------------------------------------------------
+# _FeedReader
+# ----------------------------------------------------------------------
+
+
+def test_reader_handles_arbitrary_chunk_boundaries() -> None:
+    reader = _FeedReader(max_items=10)
+    for chunk in _chunks(_feed(3), size=7):
+        reader.feed(chunk)
+    reader.close()
+
+    assert reader.has_channel
+    assert reader.channel_title == "Stories by Ann Lee on Medium"
+    assert reader.creator == "Ann Lee"
+    assert [a["title"] for a in reader.articles] == ["Post 0", "Post 1", "Post 2"]
+    assert reader.articles[0]["tags"] == ["python"]
+    assert reader.links == [f"https://medium.com/@ann/{n}" for n in range(3)]
+
+
+def test_reader_is_done_once_enough_is_known() -> None:
+    reader = _FeedReader(max_items=2)
+    reader.feed(_HEAD + _item(0) + _item(1))
+    assert reader.done
+    assert len(reader.articles) == 2
+
+
+def test_reader_keeps_reading_until_creator_is_seen() -> None:
+    reader = _FeedReader(max_items=1)
+    reader.feed(_HEAD + _item(0, creator=False))
+    assert not reader.done
+    reader.feed(_item(1))
+    assert reader.done
+    assert [a["title"] for a in reader.articles] == ["Post 0"]
+
+
+def test_reader_rejects_truncated_feed() -> None:
+    reader = _FeedReader(max_items=10)
+    reader.feed(_HEAD + _item(0) + _item(1)[:30])
+    with pytest.raises(etree.XMLSyntaxError):
+        reader.close()
+    # Whatever was complete before the cut is still available.
+    assert [a["title"] for a in reader.articles] == ["Post 0"]
+
+
+def test_reader_without_channel() -> None:
+    reader = _FeedReader(max_items=10)
+    reader.feed(b"<html><body><item><title>x</title></item></body></html>")
+    reader.close()
+    assert not reader.has_channel
+    assert reader.articles == []
+
+
+# ----------------------------------------------------------------------
+# MediumScraper
+# ----------------------------------------------------------------------
+
+
+async def test_scrape_builds_items() -> None:
+    data, _ = await _scrape(_feed(3), max_items=10)
+
+    assert data.username == "ann"
+    assert data.raw["author_name"] == "Ann Lee"
+    assert [i.category for i in data.items] == ["profile"] + ["article"] * 3
+    assert data.items[1].url == "https://medium.com/@ann/0"
+
+
+async def test_scrape_stops_reading_early() -> None:
+    data, stream = await _scrape(_feed(200), max_items=2)
+
+    assert len([i for i in data.items if i.category == "article"]) == 2
+    assert stream.sent < len(stream.chunks)
+
+
+async def test_scrape_tolerates_truncation_after_enough_items() -> None:
+    body = _feed(5)
+    data, _ = await _scrape(body[: len(body) - 40], max_items=2)
+    assert len([i for i in data.items if i.category == "article"]) == 2
+
+
+async def test_scrape_raises_on_truncated_feed() -> None:
+    body = _HEAD + _item(0) + _item(1)[:30]
+    with pytest.raises(etree.XMLSyntaxError):
+        await _scrape(body, max_items=5)
+
+
+async def test_scrape_raises_on_feed_without_channel() -> None:
+    with pytest.raises(ValueError, match="no channel"):
+        await _scrape(b"<rss><nothing/></rss>", max_items=5)
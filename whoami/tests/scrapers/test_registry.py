@@ -0,0 +1,24 @@
+"""Tests for the static scraper registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from whoami.scrapers import get_scraper_specs
+
+
+@pytest.mark.parametrize(
+    "spec", get_scraper_specs(), ids=lambda spec: spec.class_name,
+)
+def test_spec_hosts_match_scraper_class(spec) -> None:
+    # The router dispatches on spec.hosts before the module is imported, so
+    # they must agree with what the class itself declares.
+    scraper = spec.load()
+    if scraper is None:
+        pytest.skip(f"{spec.module} is unavailable here")
+    assert type(scraper).__name__ == spec.class_name
+    assert scraper.hosts == spec.hosts
+
+
+def test_generic_scraper_is_last() -> None:
+    assert get_scraper_specs()[-1].class_name == "GenericScraper"
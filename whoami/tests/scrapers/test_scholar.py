@@ -0,0 +1,63 @@
+"""Tests for the Google Scholar scraper's memoised author fetch."""
+
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+import pytest
+
+from whoami.scrapers.scholar import GoogleScholarScraper
+
+
+class _FakeScholarly:
+    def __init__(self) -> None:
+        self.lookups: list[str] = []
+
+    def search_author_id(self, author_id: str) -> dict[str, Any]:
+        self.lookups.append(author_id)
+        return {"scholar_id": author_id}
+
+    def fill(self, author: dict[str, Any], **_: Any) -> dict[str, Any]:
+        return {
+            **author,
+            "name": "Ada",
+            "container_type": "Author",
+            "publications": [
+                {"bib": {"title": "On Engines", "abstract": "..."}, "num_citations": 7},
+            ],
+        }
+
+
+@pytest.fixture
+def fake_scholarly(monkeypatch: pytest.MonkeyPatch) -> _FakeScholarly:
+    fake = _FakeScholarly()
+    monkeypatch.setitem(sys.modules, "scholarly", types.SimpleNamespace(scholarly=fake))
+    GoogleScholarScraper._fetch_author_cached.cache_clear()
+    yield fake
+    GoogleScholarScraper._fetch_author_cached.cache_clear()
+
+
+def test_repeat_fetch_is_served_from_cache(fake_scholarly: _FakeScholarly) -> None:
+    GoogleScholarScraper._fetch_author("abc", 5)
+    GoogleScholarScraper._fetch_author("abc", 5)
+    assert fake_scholarly.lookups == ["abc"]
+
+
+def test_caller_mutation_does_not_leak_into_cache(fake_scholarly: _FakeScholarly) -> None:
+    first = GoogleScholarScraper._fetch_author("abc", 5)
+    first["name"] = "changed"
+    first["publications"][0]["bib"]["title"] = "changed"
+
+    second = GoogleScholarScraper._fetch_author("abc", 5)
+    assert second["name"] == "Ada"
+    assert second["publications"][0]["bib"]["title"] == "On Engines"
+
+
+def test_only_used_fields_are_kept(fake_scholarly: _FakeScholarly) -> None:
+    author = GoogleScholarScraper._fetch_author("abc", 5)
+    assert "container_type" not in author
+    assert author["publications"] == [
+        {"bib": {"title": "On Engines"}, "num_citations": 7},
+    ]
@@ -0,0 +1,63 @@
+"""Scrapers apply ``ScraperConfig.timeout`` to every request they make."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from whoami.models import ScraperConfig
+from whoami.scrapers.bilibili import BilibiliScraper
+from whoami.scrapers.weibo import WeiboScraper
+from whoami.scrapers.xiaohongshu import XiaohongshuScraper
+from whoami.scrapers.zhihu import ZhihuScraper
+
+_TIMEOUT = 0.25
+
+
+@pytest.mark.parametrize(
+    ("scraper", "url"),
+    [
+        (BilibiliScraper(), "https://space.bilibili.com/2"),
+        (WeiboScraper(), "https://weibo.com/u/1234567890"),
+        (XiaohongshuScraper(), "https://www.xiaohongshu.com/user/profile/abc123"),
+        (ZhihuScraper(), "https://www.zhihu.com/people/someone"),
+    ],
+)
+async def test_requests_use_configured_timeout(scraper, url) -> None:
+    timeouts: list[dict[str, float]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        config = ScraperConfig(timeout=_TIMEOUT, extra={"http_client": client})
+        await scraper.scrape(url, config)
+
+    assert timeouts
+    for timeout in timeouts:
+        assert set(timeout.values()) == {_TIMEOUT}
+
+
+async def test_slow_server_is_abandoned_after_timeout() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # Stand in for a transport enforcing the request's read timeout.
+        try:
+            await asyncio.wait_for(asyncio.sleep(30), request.extensions["timeout"]["read"])
+        except TimeoutError:
+            raise httpx.ReadTimeout("timed out", request=request) from None
+        return httpx.Response(200)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        config = ScraperConfig(timeout=_TIMEOUT, extra={"http_client": client})
+        start = time.monotonic()
+        data = await XiaohongshuScraper().scrape(
+            "https://www.xiaohongshu.com/user/profile/abc123", config,
+        )
+
+    assert time.monotonic() - start < 5
+    assert data.username is None
+    assert "timed out" in data.raw["error"]
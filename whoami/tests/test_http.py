@@ -0,0 +1,73 @@
+"""Tests for the fetch_json response cache."""
+
+from __future__ import annotations
+
+import httpx
+import respx
+
+from whoami.utils import http
+
+_URL = "https://api.example.com/users/someone"
+
+
+@respx.mock
+async def test_shared_client_responses_are_cached() -> None:
+    route = respx.get(_URL).respond(json={"v": [1]})
+
+    first = await http.fetch_json(_URL, params={"p": 1})
+    first["v"].append(2)  # callers get their own decoded copy
+    second = await http.fetch_json(_URL, params={"p": 1})
+    await http.fetch_json(_URL, params={"p": 2})
+
+    assert second == {"v": [1]}
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_clear_json_cache_forgets_responses() -> None:
+    route = respx.get(_URL).respond(json={})
+    await http.fetch_json(_URL)
+    http.clear_json_cache()
+    await http.fetch_json(_URL)
+    assert route.call_count == 2
+
+
+async def test_injected_client_bypasses_cache() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"n": len(calls)})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await http.fetch_json(_URL, client=client)
+        second = await http.fetch_json(_URL, client=client)
+
+    assert (first, second) == ({"n": 1}, {"n": 2})
+    assert not http._json_cache
+
+
+@respx.mock
+async def test_cache_keys_do_not_hold_credentials() -> None:
+    respx.get(_URL).respond(json={})
+    await http.fetch_json(
+        _URL, headers={"Authorization": "Bearer s3cret"}, params={"key": "k3y"},
+    )
+    assert len(http._json_cache) == 1
+    for key in http._json_cache:
+        assert "s3cret" not in key
+        assert "k3y" not in key
+
+
+@respx.mock
+async def test_cache_is_bounded_by_total_bytes(monkeypatch) -> None:
+    monkeypatch.setattr(http, "_JSON_CACHE_MAXBYTES", 8 * 1000)
+    body = b'{"pad": "' + b"x" * 480 + b'"}'
+    for n in range(40):
+        respx.get(f"{_URL}/{n}").respond(content=body)
+        await http.fetch_json(f"{_URL}/{n}")
+
+    assert http._json_cache_bytes <= 8 * 1000
+    assert http._json_cache_bytes == sum(len(b) for _, b in http._json_cache.values())
+    # Least recently used entries went first; as many as fit are kept.
+    assert len(http._json_cache) == 8000 // len(body)
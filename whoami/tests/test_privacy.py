@@ -0,0 +1,43 @@
+"""Tests for the privacy filter."""
+
+from __future__ import annotations
+
+import pytest
+
+from whoami.utils.privacy import clean_scraped_text, strip_sensitive
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("mail me at a.b@example.com", "mail me at [REDACTED]"),
+        ("call +86 138-1234-5678 now", "call [REDACTED] now"),
+        ("server 192.168.1.10 is up", "server [REDACTED] is up"),
+        ("tel (010) 1234 5678, 10.0.0.1", "tel [REDACTED], [REDACTED]"),
+    ],
+)
+def test_redacts_each_kind(text: str, expected: str) -> None:
+    assert strip_sensitive(text) == expected
+
+
+def test_email_local_part_that_looks_like_a_phone() -> None:
+    # The email pass runs first, so the domain never leaks.
+    assert strip_sensitive("mail 1381234 5678@163.com") == "mail 1381234 [REDACTED]"
+    assert strip_sensitive("13812345678@qq.com") == "[REDACTED]"
+
+
+def test_phone_next_to_email() -> None:
+    assert (
+        strip_sensitive("138-1234-5678 / me@example.org")
+        == "[REDACTED] / [REDACTED]"
+    )
+
+
+def test_text_without_triggers_is_returned_unchanged() -> None:
+    text = "一个普通的个人简介, nothing to hide"
+    assert strip_sensitive(text) is text
+
+
+def test_clean_scraped_text_strips_and_handles_none() -> None:
+    assert clean_scraped_text(None) is None
+    assert clean_scraped_text("  x@y.io  ") == "[REDACTED]"
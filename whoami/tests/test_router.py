@@ -0,0 +1,80 @@
+"""Tests for host-based URL dispatch in LinkRouter."""
+
+from __future__ import annotations
+
+import pytest
+
+from whoami.router import LinkRouter, url_host
+from whoami.scrapers import get_scraper_specs
+
+
+@pytest.fixture(scope="module")
+def router() -> LinkRouter:
+    router = LinkRouter()
+    for spec in get_scraper_specs():
+        router.register_lazy(spec)
+    return router
+
+
+@pytest.mark.parametrize(
+    ("url", "platform"),
+    [
+        ("https://github.com/octocat", "GitHub"),
+        ("gitlab.com/someone", "GitLab"),
+        ("https://space.bilibili.com/123", "Bilibili"),
+        ("https://www.bilibili.com/video/BV1xx", "Bilibili"),
+        ("https://steamcommunity.com/id/someone", "Steam"),
+        ("https://store.steampowered.com/app/1", "Steam"),
+        ("https://stackoverflow.com/users/1/someone", "Stack Overflow"),
+        ("https://dev.to/ben", "Dev.to"),
+        ("https://medium.com/@ann", "Medium"),
+        ("https://ann.medium.com/", "Medium"),
+        ("https://www.reddit.com/user/someone", "Reddit"),
+        ("https://old.reddit.com/u/someone", "Reddit"),
+        ("https://www.zhihu.com/people/someone", "Zhihu"),
+        ("https://www.douban.com/people/someone/", "Douban"),
+        ("https://weibo.com/u/1234567890", "Weibo"),
+        ("https://www.xiaohongshu.com/user/profile/abc123", "Xiaohongshu"),
+        ("https://xhslink.com/abc", "Xiaohongshu"),
+        ("https://scholar.google.com/citations?user=abc", "Google Scholar"),
+        ("https://scholar.google.com.hk/citations?user=abc", "Google Scholar"),
+    ],
+)
+def test_resolves_by_host(router: LinkRouter, url: str, platform: str) -> None:
+    scraper = router.resolve(url)
+    assert scraper is not None
+    assert scraper.get_platform_name() == platform
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/about",
+        # Right host, but not a URL shape the Bilibili scraper handles.
+        "https://bilibili.com/foo",
+    ],
+)
+def test_unmatched_urls_fall_through_to_generic(router: LinkRouter, url: str) -> None:
+    scraper = router.resolve(url)
+    assert scraper is not None
+    assert type(scraper).__name__ == "GenericScraper"
+
+
+def test_resolve_all_keeps_input_order(router: LinkRouter) -> None:
+    urls = ["https://dev.to/ben", "https://github.com/octocat"]
+    resolved = router.resolve_all(urls)
+    assert [url for url, _ in resolved] == urls
+    assert [s.get_platform_name() for _, s in resolved] == ["Dev.to", "GitHub"]
+
+
+@pytest.mark.parametrize(
+    ("url", "host"),
+    [
+        ("https://www.GitHub.com/x", "github.com"),
+        ("gitlab.com/x", "gitlab.com"),
+        ("http://old.reddit.com:8080/u/x", "old.reddit.com"),
+        ("", ""),
+    ],
+)
+def test_url_host(url: str, host: str) -> None:
+    assert url_host(url) == host
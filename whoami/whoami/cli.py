@@ -6,22 +6,29 @@ import asyncio
 import sys
 from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from whoami.config import Config
-from whoami.models import ScrapedData, ScraperConfig
+if TYPE_CHECKING:
+    from whoami.config import Config
+    from whoami.models import ScrapedData
+    from whoami.scrapers.base import BaseScraper
 
 
 @lru_cache(maxsize=1)
 def _build_router():
-    """Build a LinkRouter with all available scrapers registered."""
+    """Build a LinkRouter with all available scrapers registered.
+
+    Scraper modules are imported on first use, so a run only pays for the
+    platforms its links actually point at.
+    """
     from whoami.router import LinkRouter
-    from whoami.scrapers import get_all_scrapers
+    from whoami.scrapers import get_scraper_specs
 
     router = LinkRouter()
-    for scraper in get_all_scrapers():
-        router.register(scraper)
+    for spec in get_scraper_specs():
+        router.register_lazy(spec)
     return router
 
 
@@ -30,6 +37,10 @@ async def _run(
     config: Config,
 ) -> list[ScrapedData]:
     """Scrape all links concurrently."""
+    from whoami.models import ScraperConfig
+    from whoami.router import url_host
+    from whoami.utils.http import close_client
+
     router = _build_router()
     scraper_config = ScraperConfig(
         timeout=config.http_timeout,
@@ -41,26 +52,48 @@ async def _run(
         },
     )
 
+    # Cap total in-flight scrapes, and per-host ones so a long list of
+    # links to one site does not trip its rate limits.
+    total_sem = asyncio.Semaphore(config.max_concurrent_scrapes)
+    host_sems: dict[str, asyncio.Semaphore] = {}
+
+    async def _bounded(scraper: BaseScraper, url: str) -> ScrapedData:
+        host = url_host(url)
+        if host not in host_sems:
+            host_sems[host] = asyncio.Semaphore(config.max_concurrent_per_host)
+        async with host_sems[host], total_sem:
+            return await scraper.scrape(url, scraper_config)
+
     tasks = []
     from whoami.scrapers.generic import GenericScraper
 
     generic = GenericScraper()
+    started: list[str] = []
     for url in links:
         scraper = router.resolve(url) or generic
-        click.echo(f"  Scraping {scraper.get_platform_name()}: {url}")
-        tasks.append(scraper.scrape(url, scraper_config))
+        started.append(f"  Scraping {scraper.get_platform_name()}: {url}")
+        tasks.append(_bounded(scraper, url))
+    click.echo("\n".join(started))
 
+    # Report each outcome as soon as its scrape finishes, so a slow
+    # platform does not hide the others' progress.
     results: list[ScrapedData] = []
-    for coro in asyncio.as_completed(tasks):
-        try:
-            data = await coro
-            results.append(data)
-            click.echo(f"  ✓ {data.platform} — {len(data.items)} items")
-        except Exception as e:
-            click.echo(f"  ✗ Error: {e}", err=True)
+    try:
+        for coro in asyncio.as_completed(tasks):
+            try:
+                data = await coro
+                results.append(data)
+                click.echo(f"  ✓ {data.platform} — {len(data.items)} items")
+            except Exception as e:
+                click.echo(f"  ✗ Error: {e}", err=True)
+    finally:
+        # Scrapers share the process-wide pooled client (same-host requests
+        # reuse connections); close it once the run is over.
+        await close_client()
     return results
 
 
+@lru_cache(maxsize=1024)
 def _detect_platform(url: str) -> str:
     """Return the platform name for a URL, or 'unknown'."""
     router = _build_router()
@@ -177,41 +210,28 @@ def main(
     no_llm: bool,
 ) -> None:
     """whoami — AI-Powered USER.md Generator."""
-    from dataclasses import replace
     from llmkit import LLMConfig, get_provider
 
-    config = Config.from_env()
-
-    # Build LLM overrides from CLI flags
-    llm_overrides: dict[str, object] = {}
-    if provider:
-        pinfo = get_provider(provider)
-        if not pinfo:
-            click.echo(f"Unknown provider: {provider}")
-            from llmkit import list_providers
-            click.echo(f"Available: {', '.join(list_providers())}")
-            sys.exit(1)
-        if pinfo.api_base:
-            llm_overrides["api_base"] = pinfo.api_base
-        if not model:
-            llm_overrides["model"] = pinfo.default_model
-        llm_overrides["provider"] = provider
-    if model:
-        llm_overrides["model"] = model
-    if api_base:
-        llm_overrides["api_base"] = api_base
-    if api_key:
-        llm_overrides["api_key"] = api_key
-    if llm_overrides:
-        config = replace(config, llm=replace(config.llm, **llm_overrides))
+    from whoami.config import Config
+
+    if provider and not get_provider(provider):
+        click.echo(f"Unknown provider: {provider}")
+        from llmkit import list_providers
+        click.echo(f"Available: {', '.join(list_providers())}")
+        sys.exit(1)
+    # CLI flags win; WWA_* variables only fill the fields they leave unset.
+    llm = LLMConfig.from_env(
+        provider=provider, model=model, api_base=api_base, api_key=api_key,
+    )
+    config = Config.from_env(llm=llm)
 
     all_links = list(link)
     if links_file:
-        all_links.extend(
-            line.strip()
-            for line in Path(links_file).read_text().splitlines()
-            if line.strip() and not line.startswith("#")
-        )
+        with open(links_file, encoding="utf-8") as fh:
+            for raw_line in fh:
+                line = raw_line.strip()
+                if line and not line.startswith("#"):
+                    all_links.append(line)
 
     if not all_links:
         all_links = _interactive_collect()
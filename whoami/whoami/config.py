@@ -7,27 +7,39 @@ from dataclasses import dataclass
 
 from llmkit import LLMConfig
 
+# Shared by every Config built without an explicit llm (LLMConfig is frozen).
+_DEFAULT_LLM = LLMConfig()
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Global configuration."""
 
-    llm: LLMConfig = LLMConfig()
+    llm: LLMConfig = _DEFAULT_LLM
     github_token: str | None = None
     youtube_api_key: str | None = None
     steam_api_key: str | None = None
     twitter_bearer_token: str | None = None
     http_timeout: float = 30.0
     max_items_per_platform: int = 50
+    max_concurrent_scrapes: int = 8
+    max_concurrent_per_host: int = 2
 
     @classmethod
-    def from_env(cls) -> Config:
+    def from_env(cls, llm: LLMConfig | None = None) -> Config:
+        """Build config from environment variables.
+
+        A prebuilt *llm* (e.g. with CLI overrides applied) skips the
+        WWA_* lookups done by ``LLMConfig.from_env()``.
+        """
         return cls(
-            llm=LLMConfig.from_env(),
+            llm=llm or LLMConfig.from_env(),
             github_token=os.getenv("GITHUB_TOKEN"),
             youtube_api_key=os.getenv("YOUTUBE_API_KEY"),
             steam_api_key=os.getenv("STEAM_API_KEY"),
             twitter_bearer_token=os.getenv("TWITTER_BEARER_TOKEN"),
             http_timeout=float(os.getenv("WHOAMI_TIMEOUT", "30")),
             max_items_per_platform=int(os.getenv("WHOAMI_MAX_ITEMS", "50")),
+            max_concurrent_scrapes=int(os.getenv("WHOAMI_CONCURRENCY", "8")),
+            max_concurrent_per_host=int(os.getenv("WHOAMI_HOST_CONCURRENCY", "2")),
         )
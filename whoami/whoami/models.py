@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any
 
-from pydantic import BaseModel, Field
 
-
-class ScraperConfig(BaseModel, frozen=True):
+@dataclass(slots=True, frozen=True)
+class ScraperConfig:
     """Configuration passed to each scraper."""
 
     timeout: float = 30.0
     max_items: int = 50
-    extra: dict[str, Any] = Field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
 
 
-class ScrapedItem(BaseModel, frozen=True):
+@dataclass(slots=True, frozen=True)
+class ScrapedItem:
     """A single piece of scraped information."""
 
     category: str
@@ -25,13 +27,19 @@ class ScrapedItem(BaseModel, frozen=True):
     url: str | None = None
 
 
-class ScrapedData(BaseModel, frozen=True):
+@dataclass(slots=True, frozen=True)
+class ScrapedData:
     """Aggregated result from a single scraper run."""
 
     platform: str
     username: str | None = None
     bio: str | None = None
-    items: list[ScrapedItem] = Field(default_factory=list)
-    raw: dict[str, Any] = Field(default_factory=dict)
-    scraped_at: datetime = Field(default_factory=datetime.utcnow)
+    items: list[ScrapedItem] = field(default_factory=list)
+    raw: dict[str, Any] = field(default_factory=dict)
+    scraped_at_ns: int = field(default_factory=time.time_ns)
     source_url: str = ""
+
+    @property
+    def scraped_at(self) -> datetime:
+        """Scrape time as an aware UTC datetime."""
+        return datetime.fromtimestamp(self.scraped_at_ns / 1e9, tz=timezone.utc)
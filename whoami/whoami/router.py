@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.url import parse_url
+
+if TYPE_CHECKING:
+    from whoami.scrapers import ScraperSpec
+
+
+def url_host(url: str) -> str:
+    """Return the lowercased hostname of *url*, without a leading ``www.``."""
+    host = parse_url(url).hostname or ""
+    return host.removeprefix("www.")
 
 
 class LinkRouter:
@@ -10,12 +22,57 @@ class LinkRouter:
 
     def __init__(self) -> None:
         self._scrapers: list[BaseScraper] = []
+        self._by_host: dict[str, BaseScraper] = {}
+        # Scrapers without declared hosts, matched by url_patterns only.
+        self._dynamic: list[BaseScraper] = []
+        # Host -> spec of a scraper module not imported yet.
+        self._pending: dict[str, ScraperSpec] = {}
 
     def register(self, scraper: BaseScraper) -> None:
         self._scrapers.append(scraper)
+        if scraper.hosts:
+            for host in scraper.hosts:
+                self._by_host.setdefault(host, scraper)
+        else:
+            self._dynamic.append(scraper)
+
+    def register_lazy(self, spec: ScraperSpec) -> None:
+        """Register a scraper module, importing it on the first URL for its hosts.
+
+        Specs without hosts are loaded immediately, since only their
+        ``url_patterns`` can match them.
+        """
+        if not spec.hosts:
+            if (scraper := spec.load()) is not None:
+                self.register(scraper)
+            return
+        for host in spec.hosts:
+            if host not in self._by_host:
+                self._pending.setdefault(host, spec)
+
+    def _load_pending(self, spec: ScraperSpec) -> None:
+        for host in spec.hosts:
+            if self._pending.get(host) is spec:
+                del self._pending[host]
+        if (scraper := spec.load()) is not None:
+            self.register(scraper)
+
+    def _lookup_host(self, host: str) -> BaseScraper | None:
+        # Walk up the domain: "old.reddit.com" -> "reddit.com".
+        while host:
+            if scraper := self._by_host.get(host):
+                return scraper
+            if spec := self._pending.get(host):
+                self._load_pending(spec)
+                continue
+            _, _, host = host.partition(".")
+        return None
 
     def resolve(self, url: str) -> BaseScraper | None:
-        for scraper in self._scrapers:
+        scraper = self._lookup_host(url_host(url))
+        if scraper is not None and scraper.can_handle(url):
+            return scraper
+        for scraper in self._dynamic:
             if scraper.can_handle(url):
                 return scraper
         return None
@@ -1,43 +1,81 @@
-"""Auto-discover and register all scrapers."""
+"""Static registry of the available scrapers."""
 
 from __future__ import annotations
 
+import functools
 import importlib
+import logging
+from dataclasses import dataclass
 
 from whoami.scrapers.base import BaseScraper
 
-_SCRAPER_MODULES = [
-    "whoami.scrapers.github",
-    "whoami.scrapers.gitlab",
-    "whoami.scrapers.bilibili",
-    "whoami.scrapers.steam",
-    "whoami.scrapers.stackoverflow",
-    "whoami.scrapers.devto",
-    "whoami.scrapers.medium",
-    "whoami.scrapers.reddit",
-    "whoami.scrapers.zhihu",
-    "whoami.scrapers.douban",
-    "whoami.scrapers.weibo",
-    "whoami.scrapers.scholar",
-    "whoami.scrapers.xiaohongshu",
-    "whoami.scrapers.generic",  # catch-all, must be last
-]
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ScraperSpec:
+    """A scraper class and the hosts it serves, known without importing it.
+
+    ``hosts`` must equal the scraper class's own ``hosts`` attribute
+    (tests/scrapers/test_registry.py checks this); specs without hosts can
+    only be matched by ``url_patterns`` and are loaded up front.
+    """
+
+    module: str
+    class_name: str
+    hosts: tuple[str, ...] = ()
+
+    def load(self) -> BaseScraper | None:
+        """Import the module and instantiate the scraper, or None if unavailable.
+
+        The outcome is memoised per spec, so a scraper whose dependencies are
+        missing costs one failed import per process, however often it is asked for.
+        """
+        return _load_spec(self)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_spec(spec: ScraperSpec) -> BaseScraper | None:
+    try:
+        mod = importlib.import_module(spec.module)
+    except ImportError:
+        logger.debug("Scraper %s unavailable", spec.module, exc_info=True)
+        return None
+    return getattr(mod, spec.class_name)()
+
+
+_SCRAPER_SPECS = (
+    ScraperSpec("whoami.scrapers.github", "GitHubScraper", ("github.com",)),
+    ScraperSpec("whoami.scrapers.gitlab", "GitLabScraper", ("gitlab.com",)),
+    ScraperSpec("whoami.scrapers.bilibili", "BilibiliScraper", ("bilibili.com",)),
+    ScraperSpec(
+        "whoami.scrapers.steam", "SteamScraper",
+        ("store.steampowered.com", "steamcommunity.com"),
+    ),
+    ScraperSpec("whoami.scrapers.stackoverflow", "StackOverflowScraper", ("stackoverflow.com",)),
+    ScraperSpec("whoami.scrapers.devto", "DevtoScraper", ("dev.to",)),
+    ScraperSpec("whoami.scrapers.medium", "MediumScraper", ("medium.com",)),
+    ScraperSpec("whoami.scrapers.reddit", "RedditScraper", ("reddit.com",)),
+    ScraperSpec("whoami.scrapers.zhihu", "ZhihuScraper", ("zhihu.com",)),
+    ScraperSpec("whoami.scrapers.douban", "DoubanScraper", ("douban.com",)),
+    ScraperSpec("whoami.scrapers.weibo", "WeiboScraper", ("weibo.com",)),
+    ScraperSpec("whoami.scrapers.scholar", "GoogleScholarScraper"),
+    ScraperSpec(
+        "whoami.scrapers.xiaohongshu", "XiaohongshuScraper",
+        ("xiaohongshu.com", "xhslink.com"),
+    ),
+    ScraperSpec("whoami.scrapers.generic", "GenericScraper"),  # catch-all, must be last
+)
+
+
+def get_scraper_specs() -> tuple[ScraperSpec, ...]:
+    """Return descriptors for all scrapers, in registration order."""
+    return _SCRAPER_SPECS
 
 
 def get_all_scrapers() -> list[BaseScraper]:
-    """Import and instantiate all available scrapers."""
-    scrapers: list[BaseScraper] = []
-    for mod_path in _SCRAPER_MODULES:
-        try:
-            mod = importlib.import_module(mod_path)
-            for attr_name in dir(mod):
-                attr = getattr(mod, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, BaseScraper)
-                    and attr is not BaseScraper
-                ):
-                    scrapers.append(attr())
-        except ImportError:
-            pass
-    return scrapers
+    """Import and instantiate all available scrapers.
+
+    Instances are created once and shared between calls.
+    """
+    return [s for spec in _SCRAPER_SPECS if (s := spec.load()) is not None]
@@ -2,15 +2,34 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
+from fnmatch import translate
+from typing import ClassVar
 
 from whoami.models import ScrapedData, ScraperConfig
+from whoami.utils.url import parse_url
+
+_NEVER_MATCHES = re.compile(r"(?!)")
 
 
 class BaseScraper(ABC):
     """All scrapers must implement this interface."""
 
     url_patterns: list[str] = []
+    # Hostnames this scraper owns (subdomains included). Lets LinkRouter
+    # dispatch with a dict lookup; leave empty for pattern-only matching.
+    hosts: tuple[str, ...] = ()
+    # url_patterns compiled into one regex; built per subclass.
+    _url_regex: ClassVar[re.Pattern[str]] = _NEVER_MATCHES
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._url_regex = (
+            re.compile("|".join(f"(?:{translate(p)})" for p in cls.url_patterns))
+            if cls.url_patterns
+            else _NEVER_MATCHES
+        )
 
     @abstractmethod
     async def scrape(self, url: str, config: ScraperConfig) -> ScrapedData:
@@ -24,9 +43,6 @@ class BaseScraper(ABC):
 
     def can_handle(self, url: str) -> bool:
         """Check if this scraper can handle the given URL."""
-        from fnmatch import fnmatch
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url if "://" in url else f"https://{url}")
+        parsed = parse_url(url)
         host_path = f"{parsed.netloc}{parsed.path}"
-        return any(fnmatch(host_path, p) for p in self.url_patterns)
+        return self._url_regex.match(host_path) is not None
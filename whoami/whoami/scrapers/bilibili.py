@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import logging
 import re
@@ -13,6 +15,7 @@ import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.http import client_for, parse_json
 
 logger = logging.getLogger(__name__)
 
@@ -28,40 +31,66 @@ _BILIBILI_HEADERS: dict[str, str] = {
 }
 
 # Lookup table for WBI mixin key derivation.
-_MIXIN_KEY_ENC_TAB: list[int] = [
+_MIXIN_KEY_ENC_TAB: tuple[int, ...] = (
     46, 47, 18, 2, 53, 8, 23, 32, 15, 50, 10, 31, 58, 3, 45, 35,
     27, 43, 5, 49, 33, 9, 42, 19, 29, 28, 14, 39, 12, 38, 41, 13,
     37, 48, 7, 16, 24, 55, 40, 61, 26, 17, 0, 1, 60, 51, 30, 4,
     22, 25, 54, 21, 56, 59, 6, 63, 57, 62, 11, 36, 20, 34, 44, 52,
-]
+)
+# Only the first 32 characters of the permuted key are used.
+_MIXIN_KEY_INDICES = _MIXIN_KEY_ENC_TAB[:32]
+
+_MID_RE = re.compile(r"space\.bilibili\.com/(\d+)")
+# Characters Bilibili strips from WBI-signed parameter values.
+_WBI_STRIP_RE = re.compile(r"[!'()*]")
 
 
 def _extract_mid(url: str) -> str | None:
     """Extract user mid (UID) from a Bilibili URL."""
-    m = re.search(r"space\.bilibili\.com/(\d+)", url)
+    m = _MID_RE.search(url)
     if m:
         return m.group(1)
     return None
 
 
-def _get_mixin_key(orig: str) -> str:
-    """Derive the mixin key used for WBI signing."""
-    return "".join(orig[i] for i in _MIXIN_KEY_ENC_TAB)[:32]
+@functools.lru_cache(maxsize=8)
+def _get_mixin_key(orig: str) -> bytes:
+    """Derive the mixin key used for WBI signing, as ASCII bytes.
+
+    The nav keys rarely change, so the permutation is cached per key pair.
+    """
+    return "".join([orig[i] for i in _MIXIN_KEY_INDICES]).encode("ascii")
 
 
 def _sign_wbi(params: dict[str, Any], img_key: str, sub_key: str) -> dict[str, str]:
     """Sign request parameters using Bilibili WBI algorithm."""
     mixin_key = _get_mixin_key(img_key + sub_key)
     params["wts"] = round(time.time())
-    params = dict(sorted(params.items()))
-    # Strip characters that Bilibili filters out.
-    params = {
-        k: re.sub(r"[!'()*]", "", str(v)) for k, v in params.items()
-    }
-    query = urllib.parse.urlencode(params)
-    wbi_sign = hashlib.md5((query + mixin_key).encode()).hexdigest()
-    params["w_rid"] = wbi_sign
-    return params
+    # Sorted (key, value) pairs, with characters Bilibili filters out stripped.
+    pairs = [
+        (k, _WBI_STRIP_RE.sub("", v if isinstance(v, str) else str(v)))
+        for k, v in sorted(params.items())
+    ]
+    query = urllib.parse.urlencode(pairs)
+    # urlencode output is pure ASCII; MD5 here is a request signature.
+    digest = hashlib.md5(query.encode("ascii"), usedforsecurity=False)
+    digest.update(mixin_key)
+    wbi_sign = digest.hexdigest()
+    return dict(pairs, w_rid=wbi_sign)
+
+
+def _json_or_none(resp: httpx.Response) -> Any:
+    """Decode a JSON body, or return None if the body is not JSON.
+
+    Bilibili sometimes answers API calls with an HTML anti-bot page and a
+    200 status; a one-byte check avoids a doomed parse.
+    """
+    if resp.content[:64].lstrip()[:1] not in (b"{", b"["):
+        logger.info(
+            "Non-JSON response from %s (HTTP %s)", resp.url, resp.status_code,
+        )
+        return None
+    return parse_json(resp)
 
 
 def _parse_card(data: dict[str, Any]) -> tuple[
@@ -95,18 +124,15 @@ def _parse_card(data: dict[str, Any]) -> tuple[
 
 def _parse_videos(data: dict[str, Any], max_items: int) -> list[ScrapedItem]:
     """Parse video search API response into ScrapedItem list."""
-    items: list[ScrapedItem] = []
     vlist = data.get("data", {}).get("list", {}).get("vlist", [])
+    items: list[ScrapedItem] = []
     for v in vlist[:max_items]:
-        title = v.get("title", "")
         bvid = v.get("bvid", "")
-        play = v.get("play", 0)
-        video_url = f"https://www.bilibili.com/video/{bvid}" if bvid else None
         items.append(ScrapedItem(
             category="video",
-            key=title,
-            value={"views": play, "bvid": bvid},
-            url=video_url,
+            key=v.get("title", ""),
+            value={"views": v.get("play", 0), "bvid": bvid},
+            url=f"https://www.bilibili.com/video/{bvid}" if bvid else None,
         ))
     return items
 
@@ -118,19 +144,21 @@ class BilibiliScraper(BaseScraper):
         "*space.bilibili.com/*",
         "*bilibili.com/video/*",
     ]
+    hosts: tuple[str, ...] = ("bilibili.com",)
 
     def get_platform_name(self) -> str:
         return "Bilibili"
 
     async def _get_wbi_keys(
-        self, client: httpx.AsyncClient,
+        self, client: httpx.AsyncClient, timeout: float,
     ) -> tuple[str, str]:
         """Fetch WBI img_key and sub_key from the nav endpoint."""
         resp = await client.get(
             "https://api.bilibili.com/x/web-interface/nav",
             headers=_BILIBILI_HEADERS,
+            timeout=timeout,
         )
-        nav = resp.json()
+        nav = _json_or_none(resp) or {}
         wbi_img = nav.get("data", {}).get("wbi_img", {})
         img_url = wbi_img.get("img_url", "")
         sub_url = wbi_img.get("sub_url", "")
@@ -139,21 +167,33 @@ class BilibiliScraper(BaseScraper):
         return img_key, sub_key
 
     async def _init_session(
-        self, client: httpx.AsyncClient,
+        self, client: httpx.AsyncClient, timeout: float,
     ) -> None:
-        """Warm up the session with cookies (buvid3/buvid4)."""
+        """Warm up the session with cookies (buvid3/buvid4).
+
+        Skipped when the (shared) client already holds them from an earlier
+        Bilibili scrape.
+        """
+        if any(
+            c.name == "buvid3" and c.value and c.domain.endswith("bilibili.com")
+            for c in client.cookies.jar
+        ):
+            return
         await client.get(
             "https://www.bilibili.com/",
             headers={"User-Agent": _BILIBILI_HEADERS["User-Agent"]},
+            timeout=timeout,
         )
         try:
             spi = await client.get(
                 "https://api.bilibili.com/x/frontend/finger/spi",
                 headers=_BILIBILI_HEADERS,
+                timeout=timeout,
             )
-            spi_data = spi.json().get("data", {})
-            client.cookies.set("buvid3", spi_data.get("b_3", ""))
-            client.cookies.set("buvid4", spi_data.get("b_4", ""))
+            spi_data = (_json_or_none(spi) or {}).get("data", {})
+            # Scope to Bilibili: the client may be shared with other scrapers.
+            client.cookies.set("buvid3", spi_data.get("b_3", ""), domain=".bilibili.com")
+            client.cookies.set("buvid4", spi_data.get("b_4", ""), domain=".bilibili.com")
         except Exception:  # noqa: BLE001
             pass
 
@@ -173,21 +213,34 @@ class BilibiliScraper(BaseScraper):
         bio: str | None = None
         raw: dict[str, Any] = {}
 
-        async with httpx.AsyncClient(
-            timeout=config.timeout, follow_redirects=True,
-        ) as client:
+        async with client_for(config) as client:
             # Warm up session for cookies.
-            await self._init_session(client)
+            await self._init_session(client, config.timeout)
 
-            # --- user info via card API ---
-            try:
-                resp = await client.get(
+            # Card, stat and nav are independent once cookies are set.
+            card_resp, stat_resp, wbi_keys = await asyncio.gather(
+                client.get(
                     "https://api.bilibili.com/x/web-interface/card",
                     headers=_BILIBILI_HEADERS,
                     params={"mid": mid, "photo": "true"},
-                )
-                card_data = resp.json()
-                if card_data.get("code") == 0:
+                    timeout=config.timeout,
+                ),
+                client.get(
+                    "https://api.bilibili.com/x/relation/stat",
+                    headers=_BILIBILI_HEADERS,
+                    params={"vmid": mid},
+                    timeout=config.timeout,
+                ),
+                self._get_wbi_keys(client, config.timeout),
+                return_exceptions=True,
+            )
+
+            # --- user info via card API ---
+            try:
+                if isinstance(card_resp, BaseException):
+                    raise card_resp
+                card_data = _json_or_none(card_resp)
+                if card_data and card_data.get("code") == 0:
                     username, bio, profile_items, card_raw = _parse_card(
                         card_data,
                     )
@@ -198,13 +251,10 @@ class BilibiliScraper(BaseScraper):
 
             # --- follower / following stats ---
             try:
-                resp = await client.get(
-                    "https://api.bilibili.com/x/relation/stat",
-                    headers=_BILIBILI_HEADERS,
-                    params={"vmid": mid},
-                )
-                stat_data = resp.json()
-                if stat_data.get("code") == 0:
+                if isinstance(stat_resp, BaseException):
+                    raise stat_resp
+                stat_data = _json_or_none(stat_resp)
+                if stat_data and stat_data.get("code") == 0:
                     sd = stat_data.get("data", {})
                     items.append(ScrapedItem(
                         category="stats",
@@ -223,7 +273,9 @@ class BilibiliScraper(BaseScraper):
             # --- videos via WBI-signed endpoint (with fallback) ---
             video_fetched = False
             try:
-                img_key, sub_key = await self._get_wbi_keys(client)
+                if isinstance(wbi_keys, BaseException):
+                    raise wbi_keys
+                img_key, sub_key = wbi_keys
                 if img_key and sub_key:
                     signed = _sign_wbi(
                         {"mid": mid, "ps": 20, "pn": 1},
@@ -234,9 +286,10 @@ class BilibiliScraper(BaseScraper):
                         "https://api.bilibili.com/x/space/wbi/arc/search",
                         headers=_BILIBILI_HEADERS,
                         params=signed,
+                        timeout=config.timeout,
                     )
-                    video_data = resp.json()
-                    if video_data.get("code") == 0:
+                    video_data = _json_or_none(resp)
+                    if video_data and video_data.get("code") == 0:
                         items.extend(
                             _parse_videos(video_data, config.max_items),
                         )
@@ -252,9 +305,10 @@ class BilibiliScraper(BaseScraper):
                         "https://api.bilibili.com/x/space/arc/search",
                         headers=_BILIBILI_HEADERS,
                         params={"mid": mid, "ps": "20", "pn": "1"},
+                        timeout=config.timeout,
                     )
-                    video_data = resp.json()
-                    if video_data.get("code") == 0:
+                    video_data = _json_or_none(resp)
+                    if video_data and video_data.get("code") == 0:
                         items.extend(
                             _parse_videos(video_data, config.max_items),
                         )
@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from urllib.parse import urlparse
-
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_json
+from whoami.utils.http import client_for, fetch_json
+from whoami.utils.url import parse_url
 
 
 class DevtoScraper(BaseScraper):
     """Scraper for Dev.to profiles and articles."""
 
     url_patterns = ["dev.to/*"]
+    hosts = ("dev.to",)
 
     def get_platform_name(self) -> str:
         return "Dev.to"
@@ -25,12 +24,14 @@ class DevtoScraper(BaseScraper):
         headers = {"User-Agent": "whoami-scraper", "Accept": "application/json"}
 
         # Fetch articles (includes user info in each article)
-        articles_data = await fetch_json(
-            "https://dev.to/api/articles",
-            params={"username": username, "per_page": min(config.max_items, 20)},
-            headers=headers,
-            timeout=config.timeout,
-        )
+        async with client_for(config) as client:
+            articles_data = await fetch_json(
+                "https://dev.to/api/articles",
+                params={"username": username, "per_page": min(config.max_items, 20)},
+                headers=headers,
+                timeout=config.timeout,
+                client=client,
+            )
 
         # Extract user data from first article
         user_data = articles_data[0]["user"] if articles_data else {}
@@ -43,12 +44,11 @@ class DevtoScraper(BaseScraper):
             bio=user_data.get("summary"),
             items=items,
             raw={"user": user_data, "articles": articles_data},
-            scraped_at=datetime.utcnow(),
             source_url=url,
         )
 
     def _extract_username(self, url: str) -> str:
-        parsed = urlparse(url if "://" in url else f"https://{url}")
+        parsed = parse_url(url)
         path = parsed.path.strip("/")
         return path.split("/")[0] if path else ""
 
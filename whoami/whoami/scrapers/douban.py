@@ -4,19 +4,42 @@ from __future__ import annotations
 
 import logging
 import re
-from urllib.parse import urlparse
+
+import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_text
+from whoami.utils.http import client_for, fetch_text
+from whoami.utils.url import parse_url
 
 logger = logging.getLogger(__name__)
 
+_TITLE_RE = re.compile(r"<title>\s*([^<\n]+)\s*</title>")
+_NAME_RE = re.compile(r'<div class="name"[^>]*>([^<]+)</div>')
+_INTRO_RE = re.compile(r'<div class="intro"[^>]*>([^<]+)</div>')
+# Profile and sidebar fields, found in a single scan; group names are item keys.
+_PROFILE_RE = re.compile(
+    r'常居:&nbsp;<a[^>]*>(?P<location>[^<]+)</a>'
+    r'|(?P<join_date>\d{4}-\d{2}-\d{2})\s*加入'
+    r'|(?P<movies_watched>\d+)部看过'
+    r'|(?P<books_read>\d+)本读过'
+    r'|(?P<music_listened>\d+)张听过'
+)
+# (key, category, converter), in output order.
+_PROFILE_FIELDS = (
+    ("location", "profile", str.strip),
+    ("join_date", "profile", str),
+    ("movies_watched", "stats", int),
+    ("books_read", "stats", int),
+    ("music_listened", "stats", int),
+)
+
 
 class DoubanScraper(BaseScraper):
     """Scrape public Douban profiles via HTML parsing."""
 
     url_patterns: list[str] = ["*douban.com/people/*"]
+    hosts: tuple[str, ...] = ("douban.com",)
 
     def get_platform_name(self) -> str:
         return "Douban"
@@ -26,7 +49,8 @@ class DoubanScraper(BaseScraper):
         profile_url = f"https://www.douban.com/people/{user_id}/"
 
         try:
-            html = await self._fetch_profile(profile_url, config.timeout)
+            async with client_for(config) as client:
+                html = await self._fetch_profile(client, profile_url, config.timeout)
             items = self._parse_profile(html, profile_url)
             username = self._extract_username(html)
             bio = self._extract_bio(html)
@@ -53,30 +77,32 @@ class DoubanScraper(BaseScraper):
     @staticmethod
     def _extract_user_id(url: str) -> str:
         """Extract user ID from Douban URL."""
-        parsed = urlparse(url if "://" in url else f"https://{url}")
+        parsed = parse_url(url)
         parts = [p for p in parsed.path.strip("/").split("/") if p]
         if len(parts) >= 2 and parts[0] == "people":
             return parts[1]
         raise ValueError(f"Cannot extract Douban user ID from URL: {url}")
 
-    async def _fetch_profile(self, url: str, timeout: float) -> str:
+    async def _fetch_profile(
+        self, client: httpx.AsyncClient, url: str, timeout: float
+    ) -> str:
         """Fetch profile HTML with anti-scraping headers."""
         headers = {
             "Referer": "https://www.douban.com/",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         }
-        return await fetch_text(url, headers=headers, timeout=timeout)
+        return await fetch_text(url, headers=headers, timeout=timeout, client=client)
 
     @staticmethod
     def _extract_username(html: str) -> str | None:
         """Extract username from HTML."""
-        title_match = re.search(r"<title>\s*([^<\n]+)\s*</title>", html, re.DOTALL)
+        title_match = _TITLE_RE.search(html)
         if title_match:
             username = title_match.group(1).strip()
             if username and username != "豆瓣":
                 return username
 
-        name_match = re.search(r'<div class="name"[^>]*>([^<]+)</div>', html)
+        name_match = _NAME_RE.search(html)
         if name_match:
             return name_match.group(1).strip()
 
@@ -85,7 +111,7 @@ class DoubanScraper(BaseScraper):
     @staticmethod
     def _extract_bio(html: str) -> str | None:
         """Extract bio/intro from HTML."""
-        bio_match = re.search(r'<div class="intro"[^>]*>([^<]+)</div>', html)
+        bio_match = _INTRO_RE.search(html)
         if bio_match:
             return bio_match.group(1).strip()
 
@@ -93,78 +119,21 @@ class DoubanScraper(BaseScraper):
 
     def _parse_profile(self, html: str, profile_url: str) -> list[ScrapedItem]:
         """Parse profile HTML and extract items."""
-        items: list[ScrapedItem] = []
-
-        items.extend(self._extract_profile_info(html, profile_url))
-        items.extend(self._extract_stats(html, profile_url))
-
-        return items
-
-    @staticmethod
-    def _extract_profile_info(html: str, profile_url: str) -> list[ScrapedItem]:
-        """Extract profile information."""
-        items: list[ScrapedItem] = []
-
-        location_match = re.search(r'常居:&nbsp;<a[^>]*>([^<]+)</a>', html)
-        if location_match:
-            items.append(
-                ScrapedItem(
-                    category="profile",
-                    key="location",
-                    value=location_match.group(1).strip(),
-                    url=profile_url,
-                )
-            )
-
-        join_match = re.search(r'(\d{4}-\d{2}-\d{2})\s*加入', html)
-        if join_match:
-            items.append(
-                ScrapedItem(
-                    category="profile",
-                    key="join_date",
-                    value=join_match.group(1),
-                    url=profile_url,
-                )
+        found: dict[str, str] = {}
+        for m in _PROFILE_RE.finditer(html):
+            key = m.lastgroup
+            if key and key not in found:  # first occurrence wins
+                found[key] = m.group(key)
+                if len(found) == len(_PROFILE_FIELDS):
+                    break
+
+        return [
+            ScrapedItem(
+                category=category,
+                key=key,
+                value=convert(found[key]),
+                url=profile_url,
             )
-
-        return items
-
-    @staticmethod
-    def _extract_stats(html: str, profile_url: str) -> list[ScrapedItem]:
-        """Extract statistics from sidebar."""
-        items: list[ScrapedItem] = []
-
-        movie_match = re.search(r'(\d+)部看过', html)
-        if movie_match:
-            items.append(
-                ScrapedItem(
-                    category="stats",
-                    key="movies_watched",
-                    value=int(movie_match.group(1)),
-                    url=profile_url,
-                )
-            )
-
-        book_match = re.search(r'(\d+)本读过', html)
-        if book_match:
-            items.append(
-                ScrapedItem(
-                    category="stats",
-                    key="books_read",
-                    value=int(book_match.group(1)),
-                    url=profile_url,
-                )
-            )
-
-        music_match = re.search(r'(\d+)张听过', html)
-        if music_match:
-            items.append(
-                ScrapedItem(
-                    category="stats",
-                    key="music_listened",
-                    value=int(music_match.group(1)),
-                    url=profile_url,
-                )
-            )
-
-        return items
+            for key, category, convert in _PROFILE_FIELDS
+            if key in found
+        ]
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from functools import partial
 from typing import Any
-from urllib.parse import urlparse
-
-import trafilatura
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_text
+from whoami.utils.http import client_for, fetch_text
+from whoami.utils.url import parse_url
 
 _TABLE_NOISE_RE = re.compile(r"^[\s|_\-+=]+$")
+# Value types kept in ScrapedData.raw (None is checked separately).
+_JSONABLE = (str, int, float, bool, list, dict)
+# [^<]* cannot run past the next tag, so a missing or unclosed </title>
+# costs one linear scan instead of a lazy search to the end of the page.
+_HTML_TITLE_RE = re.compile(r"<title[^>]*>([^<]*)</title>", re.IGNORECASE)
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +38,15 @@ class GenericScraper(BaseScraper):
         domain = self._extract_domain(url)
 
         try:
-            html = await fetch_text(url, timeout=config.timeout)
+            async with client_for(config) as client:
+                html = await fetch_text(url, timeout=config.timeout, client=client)
         except Exception:
             logger.warning("Failed to fetch %s", url, exc_info=True)
             return ScrapedData(platform=domain, source_url=url)
 
-        extracted = self._extract(html, url)
+        # trafilatura is synchronous and CPU-heavy; keep it off the event loop.
+        loop = asyncio.get_running_loop()
+        extracted = await loop.run_in_executor(None, partial(self._extract, html, url))
         if extracted is None:
             return ScrapedData(platform=domain, source_url=url)
 
@@ -48,7 +56,7 @@ class GenericScraper(BaseScraper):
 
         items = self._build_items(extracted, url)
         bio = extracted.get("description") or self._first_paragraph(extracted.get("text"))
-        raw = {k: v for k, v in extracted.items() if isinstance(v, (str, int, float, bool, list, dict, type(None)))}
+        raw = {k: v for k, v in extracted.items() if v is None or isinstance(v, _JSONABLE)}
 
         return ScrapedData(
             platform=domain,
@@ -64,13 +72,17 @@ class GenericScraper(BaseScraper):
 
     @staticmethod
     def _extract_domain(url: str) -> str:
-        parsed = urlparse(url if "://" in url else f"https://{url}")
+        parsed = parse_url(url)
         host = parsed.netloc or parsed.path.split("/")[0]
         return host.removeprefix("www.")
 
     @staticmethod
     def _extract(html: str, url: str) -> dict[str, Any] | None:
         try:
+            # Imported on first use: trafilatura pulls in lxml and friends,
+            # which a run without generic pages never needs.
+            import trafilatura
+
             result = trafilatura.bare_extraction(
                 html,
                 url=url,
@@ -111,7 +123,7 @@ class GenericScraper(BaseScraper):
 
     @staticmethod
     def _extract_html_title(html: str) -> str | None:
-        match = re.search(r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
+        match = _HTML_TITLE_RE.search(html)
         if match:
             title = match.group(1).strip()
             return title if title else None
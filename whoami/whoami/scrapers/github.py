@@ -1,25 +1,58 @@
-"""GitHub profile scraper using REST API v3."""
+"""GitHub profile scraper using the REST API v3, or GraphQL v4 with a token."""
 
 from __future__ import annotations
 
 import asyncio
 import logging
 from typing import Any
-from urllib.parse import urlparse
+
+import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_json
+from whoami.utils.http import client_for, fetch_json, post_json
+from whoami.utils.url import parse_url
 
 logger = logging.getLogger(__name__)
 
 _API_BASE = "https://api.github.com"
+_PROFILE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("name", "name"),
+    ("location", "location"),
+    ("company", "company"),
+    ("blog", "blog"),
+    ("twitter_username", "twitter"),
+    ("public_repos", "public_repos"),
+    ("followers", "followers"),
+    ("following", "following"),
+)
+
+# One GraphQL round-trip replacing the user, repos and orgs REST calls.
+# GraphQL requires authentication, so it is only used with a token.
+_GRAPHQL_QUERY = """
+query($login: String!, $first: Int!) {
+  user(login: $login) {
+    login name location company bio websiteUrl twitterUsername url
+    followers { totalCount }
+    following { totalCount }
+    repositories(
+      first: $first, ownerAffiliations: OWNER, privacy: PUBLIC,
+      orderBy: {field: STARGAZERS, direction: DESC}
+    ) {
+      totalCount
+      nodes { name description url stargazerCount forkCount primaryLanguage { name } }
+    }
+    organizations(first: 100) { nodes { login description } }
+  }
+}
+"""
 
 
 class GitHubScraper(BaseScraper):
-    """Scrape public GitHub profiles via the REST API."""
+    """Scrape public GitHub profiles via the REST API (GraphQL with a token)."""
 
     url_patterns: list[str] = ["github.com/*"]
+    hosts: tuple[str, ...] = ("github.com",)
 
     def get_platform_name(self) -> str:
         return "GitHub"
@@ -34,12 +67,25 @@ class GitHubScraper(BaseScraper):
         headers = self._build_headers(token)
         timeout = config.timeout
 
-        # Fetch user profile, repos, and orgs concurrently.
-        user_data, repos_data, orgs_data = await asyncio.gather(
-            self._fetch_user(username, headers, timeout),
-            self._fetch_repos(username, headers, timeout, config.max_items),
-            self._fetch_orgs(username, headers, timeout),
-        )
+        async with client_for(config) as client:
+            graphql = (
+                await self._fetch_graphql(client, username, headers, timeout, config.max_items)
+                if token
+                else None
+            )
+            if graphql is not None:
+                user_data, repos_data, orgs_data = graphql
+                if orgs_data is None:
+                    # Partial GraphQL result (e.g. token without read:org):
+                    # public orgs still come from REST, which needs no scope.
+                    orgs_data = await self._fetch_orgs(client, username, headers, timeout)
+            else:
+                # Fetch user profile, repos, and orgs concurrently.
+                user_data, repos_data, orgs_data = await asyncio.gather(
+                    self._fetch_user(client, username, headers, timeout),
+                    self._fetch_repos(client, username, headers, timeout, config.max_items),
+                    self._fetch_orgs(client, username, headers, timeout),
+                )
 
         items: list[ScrapedItem] = []
 
@@ -60,7 +106,11 @@ class GitHubScraper(BaseScraper):
             username=username,
             bio=user_data.get("bio") if user_data else None,
             items=items,
-            raw={"user": user_data or {}, "repos": repos_data or [], "orgs": orgs_data or []},
+            raw=(
+                {"user": user_data or {}, "repos": repos_data or [], "orgs": orgs_data or []}
+                if config.extra.get("include_raw", False)
+                else {}
+            ),
             source_url=url,
         )
 
@@ -70,11 +120,10 @@ class GitHubScraper(BaseScraper):
 
     @staticmethod
     def _extract_username(url: str) -> str:
-        parsed = urlparse(url if "://" in url else f"https://{url}")
-        parts = [p for p in parsed.path.strip("/").split("/") if p]
-        if not parts:
+        username = parse_url(url).path.strip("/").partition("/")[0]
+        if not username:
             raise ValueError(f"Cannot extract GitHub username from URL: {url}")
-        return parts[0]
+        return username
 
     @staticmethod
     def _build_headers(token: str | None) -> dict[str, str]:
@@ -88,11 +137,18 @@ class GitHubScraper(BaseScraper):
     # ------------------------------------------------------------------
 
     async def _fetch_user(
-        self, username: str, headers: dict[str, str], timeout: float
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        headers: dict[str, str],
+        timeout: float,
     ) -> dict[str, Any] | None:
         try:
             return await fetch_json(
-                f"{_API_BASE}/users/{username}", headers=headers, timeout=timeout
+                f"{_API_BASE}/users/{username}",
+                headers=headers,
+                timeout=timeout,
+                client=client,
             )
         except Exception:
             logger.warning("Failed to fetch user profile for %s", username, exc_info=True)
@@ -100,6 +156,7 @@ class GitHubScraper(BaseScraper):
 
     async def _fetch_repos(
         self,
+        client: httpx.AsyncClient,
         username: str,
         headers: dict[str, str],
         timeout: float,
@@ -112,71 +169,146 @@ class GitHubScraper(BaseScraper):
                 headers=headers,
                 params={"sort": "stargazers_count", "direction": "desc", "per_page": per_page},
                 timeout=timeout,
+                client=client,
             )
             if isinstance(data, list):
-                return sorted(data, key=lambda r: r.get("stargazers_count", 0), reverse=True)
+                # The repos endpoint cannot sort by stars, so order them here.
+                data.sort(key=lambda r: r.get("stargazers_count", 0), reverse=True)
+                return data
             return None
         except Exception:
             logger.warning("Failed to fetch repos for %s", username, exc_info=True)
             return None
 
     async def _fetch_orgs(
-        self, username: str, headers: dict[str, str], timeout: float
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        headers: dict[str, str],
+        timeout: float,
     ) -> list[dict[str, Any]] | None:
         try:
             data = await fetch_json(
-                f"{_API_BASE}/users/{username}/orgs", headers=headers, timeout=timeout
+                f"{_API_BASE}/users/{username}/orgs",
+                headers=headers,
+                timeout=timeout,
+                client=client,
             )
             return data if isinstance(data, list) else None
         except Exception:
             logger.warning("Failed to fetch orgs for %s", username, exc_info=True)
             return None
 
+    async def _fetch_graphql(
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        headers: dict[str, str],
+        timeout: float,
+        max_items: int,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]] | None] | None:
+        """Fetch user, repos and orgs in one GraphQL query, in REST shape.
+
+        Returns None when the query fails, so the caller can fall back to REST.
+        Orgs are None when the reply was partial, as they are not trustworthy.
+        """
+        try:
+            data = await post_json(
+                f"{_API_BASE}/graphql",
+                json={
+                    "query": _GRAPHQL_QUERY,
+                    "variables": {"login": username, "first": min(max_items, 100)},
+                },
+                headers=headers,
+                timeout=timeout,
+                client=client,
+            )
+            user = (data.get("data") or {}).get("user")
+            if not user:
+                logger.info("GraphQL lookup failed for %s: %s", username, data.get("errors"))
+                return None
+            if errors := data.get("errors"):
+                logger.info("Partial GraphQL result for %s: %s", username, errors)
+            return self._graphql_to_rest(user, partial=bool(errors))
+        except Exception:
+            logger.warning("GraphQL fetch failed for %s", username, exc_info=True)
+            return None
+
+    @staticmethod
+    def _graphql_to_rest(
+        user: dict[str, Any], *, partial: bool = False,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]] | None]:
+        """Map a GraphQL ``user`` node onto the REST user/repos/orgs payloads.
+
+        Orgs are None if the reply carried errors or no ``organizations``
+        connection: those fields resolve to null without ``read:org``.
+        """
+        repositories = user.get("repositories") or {}
+        user_data = {
+            "login": user.get("login"),
+            "name": user.get("name"),
+            "location": user.get("location"),
+            "company": user.get("company"),
+            "bio": user.get("bio"),
+            "blog": user.get("websiteUrl") or "",
+            "twitter_username": user.get("twitterUsername"),
+            "html_url": user.get("url"),
+            "public_repos": repositories.get("totalCount", 0),
+            "followers": (user.get("followers") or {}).get("totalCount", 0),
+            "following": (user.get("following") or {}).get("totalCount", 0),
+        }
+        repos_data = [
+            {
+                "name": repo.get("name"),
+                "description": repo.get("description"),
+                "language": (repo.get("primaryLanguage") or {}).get("name"),
+                "stargazers_count": repo.get("stargazerCount", 0),
+                "forks_count": repo.get("forkCount", 0),
+                "html_url": repo.get("url"),
+            }
+            for repo in repositories.get("nodes") or ()
+            if repo
+        ]
+        organizations = user.get("organizations")
+        if partial or organizations is None:
+            return user_data, repos_data, None
+        orgs_data = [
+            {"login": org.get("login"), "description": org.get("description")}
+            for org in organizations.get("nodes") or ()
+            if org
+        ]
+        return user_data, repos_data, orgs_data
+
     # ------------------------------------------------------------------
     # Item builders
     # ------------------------------------------------------------------
 
     @staticmethod
     def _build_profile_items(user: dict[str, Any]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
         profile_url = user.get("html_url")
 
-        field_map: dict[str, str] = {
-            "name": "name",
-            "location": "location",
-            "company": "company",
-            "blog": "blog",
-            "twitter_username": "twitter",
-            "public_repos": "public_repos",
-            "followers": "followers",
-            "following": "following",
-        }
-        for api_key, item_key in field_map.items():
-            val = user.get(api_key)
-            if val is not None and val != "":
-                items.append(
-                    ScrapedItem(category="profile", key=item_key, value=val, url=profile_url)
-                )
-        return items
+        return [
+            ScrapedItem(category="profile", key=item_key, value=val, url=profile_url)
+            for api_key, item_key in _PROFILE_FIELDS
+            if (val := user.get(api_key)) is not None and val != ""
+        ]
 
     @staticmethod
     def _build_repo_items(repos: list[dict[str, Any]]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
-        for repo in repos:
-            items.append(
-                ScrapedItem(
-                    category="repo",
-                    key=repo.get("name", "unknown"),
-                    value={
-                        "description": repo.get("description"),
-                        "language": repo.get("language"),
-                        "stars": repo.get("stargazers_count", 0),
-                        "forks": repo.get("forks_count", 0),
-                    },
-                    url=repo.get("html_url"),
-                )
+        return [
+            ScrapedItem(
+                category="repo",
+                key=repo.get("name", "unknown"),
+                value={
+                    "description": repo.get("description"),
+                    "language": repo.get("language"),
+                    "stars": repo.get("stargazers_count", 0),
+                    "forks": repo.get("forks_count", 0),
+                },
+                url=repo.get("html_url"),
             )
-        return items
+            for repo in repos
+        ]
 
     @staticmethod
     def _build_org_items(orgs: list[dict[str, Any]]) -> list[ScrapedItem]:
@@ -6,15 +6,22 @@ import asyncio
 import logging
 import re
 from typing import Any
-from urllib.parse import urlparse
+
+import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_json
+from whoami.utils.http import client_for, fetch_json
+from whoami.utils.url import parse_url
 
 logger = logging.getLogger(__name__)
 
 _API_BASE = "https://gitlab.com/api/v4"
+_AVATAR_ID_RE = re.compile(r"/user/avatar/(\d+)/")
+_PROFILE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("name", "name"),
+    ("path", "username"),
+)
 
 
 class GitLabScraper(BaseScraper):
@@ -37,6 +44,7 @@ class GitLabScraper(BaseScraper):
     """
 
     url_patterns: list[str] = ["gitlab.com/*"]
+    hosts: tuple[str, ...] = ("gitlab.com",)
 
     def get_platform_name(self) -> str:
         return "GitLab"
@@ -51,17 +59,22 @@ class GitLabScraper(BaseScraper):
 
         # GitLab's user search API is restricted, so we get a project first
         # to extract the user ID from the namespace
-        user_id, user_data = await self._fetch_user_id_and_data(username, timeout)
-
-        if not user_id or not user_data:
-            return ScrapedData(
-                platform=self.get_platform_name(),
-                username=username,
-                source_url=url,
+        async with client_for(config) as client:
+            user_id, user_data = await self._fetch_user_id_and_data(
+                client, username, timeout
             )
 
-        # Fetch projects using the user ID
-        projects_data = await self._fetch_projects(user_id, timeout, config.max_items)
+            if not user_id or not user_data:
+                return ScrapedData(
+                    platform=self.get_platform_name(),
+                    username=username,
+                    source_url=url,
+                )
+
+            # Fetch projects using the user ID
+            projects_data = await self._fetch_projects(
+                client, user_id, timeout, config.max_items
+            )
 
         items: list[ScrapedItem] = []
 
@@ -87,37 +100,45 @@ class GitLabScraper(BaseScraper):
 
     @staticmethod
     def _extract_username(url: str) -> str:
-        parsed = urlparse(url if "://" in url else f"https://{url}")
-        parts = [p for p in parsed.path.strip("/").split("/") if p]
-        if not parts:
+        username = parse_url(url).path.strip("/").partition("/")[0]
+        if not username:
             raise ValueError(f"Cannot extract GitLab username from URL: {url}")
-        return parts[0]
+        return username
 
     # ------------------------------------------------------------------
     # API fetchers (each returns None on failure for graceful degradation)
     # ------------------------------------------------------------------
 
     async def _fetch_user_id_and_data(
-        self, username: str, timeout: float
+        self, client: httpx.AsyncClient, username: str, timeout: float
     ) -> tuple[int | None, dict[str, Any] | None]:
         """
         Fetch user ID and data by getting one of their projects.
         GitLab's user search API is restricted, so we use the projects endpoint.
         """
         try:
-            # Strategy 1: Try common project name patterns
-            common_names = [username, username.lower(), username.upper(), "dotfiles", "config"]
-            for name in common_names:
-                try:
-                    project = await fetch_json(
+            # Strategy 1: Probe common project name patterns concurrently,
+            # keeping the first match in priority order
+            common_names = dict.fromkeys(
+                [username, username.lower(), username.upper(), "dotfiles", "config"]
+            )
+            results = await asyncio.gather(
+                *(
+                    fetch_json(
                         f"{_API_BASE}/projects/{username}%2F{name}",
                         timeout=timeout,
+                        client=client,
                     )
-                    namespace = project.get("namespace", {})
-                    if namespace.get("kind") == "user" and namespace.get("path") == username:
-                        return self._extract_user_id_from_namespace(namespace), namespace
-                except Exception:
+                    for name in common_names
+                ),
+                return_exceptions=True,
+            )
+            for project in results:
+                if not isinstance(project, dict):
                     continue
+                namespace = project.get("namespace", {})
+                if namespace.get("kind") == "user" and namespace.get("path") == username:
+                    return self._extract_user_id_from_namespace(namespace), namespace
 
             # Strategy 2: Search for projects with username in the name
             try:
@@ -125,12 +146,12 @@ class GitLabScraper(BaseScraper):
                     f"{_API_BASE}/projects",
                     params={"search": username, "per_page": 50},
                     timeout=timeout,
+                    client=client,
                 )
 
-                for project in projects:
-                    namespace = project.get("namespace", {})
-                    if namespace.get("path") == username and namespace.get("kind") == "user":
-                        return self._extract_user_id_from_namespace(namespace), namespace
+                namespace = self._index_user_namespaces(projects).get(username)
+                if namespace is not None:
+                    return self._extract_user_id_from_namespace(namespace), namespace
             except Exception:
                 pass
 
@@ -139,27 +160,38 @@ class GitLabScraper(BaseScraper):
                 f"{_API_BASE}/projects",
                 params={"per_page": 100, "order_by": "star_count", "sort": "desc"},
                 timeout=timeout,
+                client=client,
             )
 
-            for project in projects:
-                namespace = project.get("namespace", {})
-                if namespace.get("path") == username and namespace.get("kind") == "user":
-                    return self._extract_user_id_from_namespace(namespace), namespace
+            namespace = self._index_user_namespaces(projects).get(username)
+            if namespace is not None:
+                return self._extract_user_id_from_namespace(namespace), namespace
 
         except Exception:
             logger.warning("Failed to fetch user data for %s", username, exc_info=True)
 
         return None, None
 
+    @staticmethod
+    def _index_user_namespaces(projects: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Map each user namespace path to its namespace, first project wins."""
+        by_path: dict[str, dict[str, Any]] = {}
+        for project in projects:
+            namespace = project.get("namespace")
+            if namespace is not None and namespace.get("kind") == "user":
+                by_path.setdefault(namespace.get("path"), namespace)
+        return by_path
+
     @staticmethod
     def _extract_user_id_from_namespace(namespace: dict[str, Any]) -> int | None:
         """Extract user ID from namespace avatar URL."""
         avatar_url = namespace.get("avatar_url", "")
-        match = re.search(r"/user/avatar/(\d+)/", avatar_url)
+        match = _AVATAR_ID_RE.search(avatar_url)
         return int(match.group(1)) if match else None
 
     async def _fetch_projects(
         self,
+        client: httpx.AsyncClient,
         user_id: int,
         timeout: float,
         max_items: int,
@@ -174,6 +206,7 @@ class GitLabScraper(BaseScraper):
                     "per_page": per_page,
                 },
                 timeout=timeout,
+                client=client,
             )
             if isinstance(data, list):
                 return data
@@ -188,36 +221,27 @@ class GitLabScraper(BaseScraper):
 
     @staticmethod
     def _build_profile_items(user: dict[str, Any]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
         profile_url = user.get("web_url")
 
-        field_map: dict[str, str] = {
-            "name": "name",
-            "path": "username",
-        }
-        for api_key, item_key in field_map.items():
-            val = user.get(api_key)
-            if val is not None and val != "":
-                items.append(
-                    ScrapedItem(category="profile", key=item_key, value=val, url=profile_url)
-                )
-        return items
+        return [
+            ScrapedItem(category="profile", key=item_key, value=val, url=profile_url)
+            for api_key, item_key in _PROFILE_FIELDS
+            if (val := user.get(api_key)) is not None and val != ""
+        ]
 
     @staticmethod
     def _build_project_items(projects: list[dict[str, Any]]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
-        for project in projects:
-            items.append(
-                ScrapedItem(
-                    category="project",
-                    key=project.get("name", "unknown"),
-                    value={
-                        "description": project.get("description"),
-                        "language": project.get("language"),
-                        "stars": project.get("star_count", 0),
-                        "forks": project.get("forks_count", 0),
-                    },
-                    url=project.get("web_url"),
-                )
+        return [
+            ScrapedItem(
+                category="project",
+                key=project.get("name", "unknown"),
+                value={
+                    "description": project.get("description"),
+                    "language": project.get("language"),
+                    "stars": project.get("star_count", 0),
+                    "forks": project.get("forks_count", 0),
+                },
+                url=project.get("web_url"),
             )
-        return items
+            for project in projects
+        ]
@@ -2,19 +2,100 @@
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from urllib.parse import urlparse
+from typing import Any
+
+from lxml import etree
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_text
+from whoami.utils.http import client_for, fetch_stream
+from whoami.utils.url import parse_url
+
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+
+
+class _FeedReader:
+    """Incremental RSS reader that keeps only what the scraper needs.
+
+    Fed the response body chunk by chunk, it records the channel title,
+    the first ``dc:creator`` and up to ``max_items`` articles, freeing each
+    ``<item>`` once read. ``done`` turns true as soon as the rest of the
+    feed cannot change the result.
+    """
+
+    def __init__(self, max_items: int) -> None:
+        # Feeds come from the network: never resolve entities or fetch DTDs.
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"), resolve_entities=False, no_network=True,
+        )
+        self._max_items = max_items
+        self._depth = 0
+        self.has_channel = False
+        self.channel_title: str | None = None
+        self.creator_seen = False
+        self.creator: str | None = None
+        self.articles: list[dict[str, Any]] = []
+        self.links: list[str | None] = []
+
+    @property
+    def done(self) -> bool:
+        return self.creator_seen and len(self.articles) >= self._max_items
+
+    def feed(self, data: bytes) -> None:
+        self._parser.feed(data)
+        self._read_events()
+
+    def close(self) -> None:
+        self._parser.close()
+        self._read_events()
+
+    def _read_events(self) -> None:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._depth += 1
+                if self._depth == 2 and elem.tag == "channel":
+                    self.has_channel = True
+                continue
+
+            self._depth -= 1
+            if not self.has_channel:
+                continue
+            if elem.tag == _DC_CREATOR and not self.creator_seen:
+                self.creator_seen = True
+                self.creator = elem.text
+            elif self._depth == 2 and elem.tag == "title" and self.channel_title is None:
+                self.channel_title = elem.text or ""
+            elif self._depth == 2 and elem.tag == "item":
+                if len(self.articles) < self._max_items:
+                    self._add_article(elem)
+                # Drop the item (and any earlier siblings) to bound memory.
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    def _add_article(self, article: etree._Element) -> None:
+        title_elem = article.find("title")
+        link_elem = article.find("link")
+        pub_date_elem = article.find("pubDate")
+
+        # Extract categories/tags
+        categories = [
+            cat.text for cat in article.findall("category") if cat.text
+        ]
+
+        self.articles.append({
+            "title": title_elem.text if title_elem is not None else None,
+            "published_at": pub_date_elem.text if pub_date_elem is not None else None,
+            "tags": categories,
+        })
+        self.links.append(link_elem.text if link_elem is not None else None)
 
 
 class MediumScraper(BaseScraper):
     """Scraper for Medium profiles via RSS feed."""
 
     url_patterns = ["medium.com/*", "*.medium.com*"]
+    hosts = ("medium.com",)
 
     def get_platform_name(self) -> str:
         return "Medium"
@@ -22,19 +103,24 @@ class MediumScraper(BaseScraper):
     async def scrape(self, url: str, config: ScraperConfig) -> ScrapedData:
         username = self._extract_username(url)
 
-        # Fetch RSS feed
+        # Stream and parse the RSS feed, stopping once enough is known.
         rss_url = f"https://medium.com/feed/@{username}"
-        rss_text = await fetch_text(rss_url, timeout=config.timeout)
-
-        # Parse RSS XML
-        root = ET.fromstring(rss_text)
-        channel = root.find("channel")
-
-        if channel is None:
+        reader = _FeedReader(config.max_items)
+        async with client_for(config) as client, fetch_stream(
+            rss_url, timeout=config.timeout, client=client,
+        ) as resp:
+            async for chunk in resp.aiter_bytes():
+                reader.feed(chunk)
+                if reader.done:
+                    break
+            else:
+                reader.close()
+
+        if not reader.has_channel:
             raise ValueError("Invalid RSS feed: no channel element found")
 
-        items = self._build_items(channel, config.max_items)
-        author_name = self._extract_author_name(channel)
+        author_name = self._extract_author_name(reader)
+        items = self._build_items(reader, author_name)
 
         return ScrapedData(
             platform=self.get_platform_name(),
@@ -42,19 +128,17 @@ class MediumScraper(BaseScraper):
             bio=None,
             items=items,
             raw={"rss_url": rss_url, "author_name": author_name},
-            scraped_at=datetime.utcnow(),
             source_url=url,
         )
 
     def _extract_username(self, url: str) -> str:
         """Extract username from Medium URL."""
-        parsed = urlparse(url if "://" in url else f"https://{url}")
+        parsed = parse_url(url)
         path = parsed.path.strip("/")
 
         # Handle @username format
         if "@" in path:
-            username_part = path.split("@")[1].split("/")[0]
-            return username_part
+            return path.partition("@")[2].partition("/")[0]
 
         # Handle subdomain format (username.medium.com)
         if parsed.netloc.endswith(".medium.com"):
@@ -62,31 +146,28 @@ class MediumScraper(BaseScraper):
 
         return ""
 
-    def _extract_author_name(self, channel: ET.Element) -> str | None:
-        """Extract author name from RSS channel."""
+    def _extract_author_name(self, reader: _FeedReader) -> str | None:
+        """Extract author name from the parsed feed."""
         # Try dc:creator first
-        creator = channel.find(".//{http://purl.org/dc/elements/1.1/}creator")
-        if creator is not None and creator.text:
-            return creator.text
+        if reader.creator:
+            return reader.creator
 
         # Fallback to title
-        title = channel.find("title")
-        if title is not None and title.text:
+        if reader.channel_title:
             # Medium RSS titles are often "Stories by Author Name on Medium"
-            text = title.text
+            text = reader.channel_title
             if " by " in text:
                 return text.split(" by ")[1].split(" on ")[0]
 
         return None
 
     def _build_items(
-        self, channel: ET.Element, max_items: int
+        self, reader: _FeedReader, author_name: str | None
     ) -> list[ScrapedItem]:
-        """Build scraped items from RSS channel."""
+        """Build scraped items from the parsed feed."""
         items = []
 
-        # Extract author name as profile item
-        author_name = self._extract_author_name(channel)
+        # Author name as profile item
         if author_name:
             items.append(
                 ScrapedItem(
@@ -97,30 +178,14 @@ class MediumScraper(BaseScraper):
                 )
             )
 
-        # Extract articles
-        article_items = channel.findall("item")
-        for article in article_items[:max_items]:
-            title_elem = article.find("title")
-            link_elem = article.find("link")
-            pub_date_elem = article.find("pubDate")
-
-            # Extract categories/tags
-            categories = [
-                cat.text for cat in article.findall("category") if cat.text
-            ]
-
-            article_data = {
-                "title": title_elem.text if title_elem is not None else None,
-                "published_at": pub_date_elem.text if pub_date_elem is not None else None,
-                "tags": categories,
-            }
-
+        # Articles
+        for article_data, link in zip(reader.articles, reader.links):
             items.append(
                 ScrapedItem(
                     category="article",
                     key="title",
                     value=article_data,
-                    url=link_elem.text if link_elem is not None else None,
+                    url=link,
                 )
             )
 
@@ -4,22 +4,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import Counter
 from typing import Any
-from urllib.parse import urlparse
+
+import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_json
+from whoami.utils.http import client_for, fetch_json
+from whoami.utils.url import parse_url
 
 logger = logging.getLogger(__name__)
 
 _API_BASE = "https://www.reddit.com"
+_PROFILE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("name", "username"),
+    ("link_karma", "link_karma"),
+    ("comment_karma", "comment_karma"),
+    ("total_karma", "total_karma"),
+    ("created_utc", "account_created"),
+)
 
 
 class RedditScraper(BaseScraper):
     """Scrape public Reddit profiles via the JSON API."""
 
     url_patterns: list[str] = ["*reddit.com/*"]
+    hosts: tuple[str, ...] = ("reddit.com",)
 
     def get_platform_name(self) -> str:
         return "Reddit"
@@ -34,11 +45,12 @@ class RedditScraper(BaseScraper):
         timeout = config.timeout
 
         # Fetch user about, posts, and comments concurrently.
-        about_data, posts_data, comments_data = await asyncio.gather(
-            self._fetch_about(username, headers, timeout),
-            self._fetch_posts(username, headers, timeout),
-            self._fetch_comments(username, headers, timeout),
-        )
+        async with client_for(config) as client:
+            about_data, posts_data, comments_data = await asyncio.gather(
+                self._fetch_about(client, username, headers, timeout),
+                self._fetch_posts(client, username, headers, timeout),
+                self._fetch_comments(client, username, headers, timeout),
+            )
 
         items: list[ScrapedItem] = []
 
@@ -75,29 +87,40 @@ class RedditScraper(BaseScraper):
 
     @staticmethod
     def _extract_username(url: str) -> str:
-        parsed = urlparse(url if "://" in url else f"https://{url}")
-        parts = [p for p in parsed.path.strip("/").split("/") if p]
-        if len(parts) < 2 or parts[0] not in ("user", "u"):
+        kind, _, rest = parse_url(url).path.strip("/").partition("/")
+        username = rest.lstrip("/").partition("/")[0]
+        if kind not in ("user", "u") or not username:
             raise ValueError(f"Cannot extract Reddit username from URL: {url}")
-        return parts[1]
+        return username
 
     # ------------------------------------------------------------------
     # API fetchers (each returns None on failure for graceful degradation)
     # ------------------------------------------------------------------
 
     async def _fetch_about(
-        self, username: str, headers: dict[str, str], timeout: float
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        headers: dict[str, str],
+        timeout: float,
     ) -> dict[str, Any] | None:
         try:
             return await fetch_json(
-                f"{_API_BASE}/user/{username}/about.json", headers=headers, timeout=timeout
+                f"{_API_BASE}/user/{username}/about.json",
+                headers=headers,
+                timeout=timeout,
+                client=client,
             )
         except Exception:
             logger.warning("Failed to fetch about for %s", username, exc_info=True)
             return None
 
     async def _fetch_posts(
-        self, username: str, headers: dict[str, str], timeout: float
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        headers: dict[str, str],
+        timeout: float,
     ) -> dict[str, Any] | None:
         try:
             return await fetch_json(
@@ -105,13 +128,18 @@ class RedditScraper(BaseScraper):
                 headers=headers,
                 params={"limit": 20, "sort": "top", "t": "all"},
                 timeout=timeout,
+                client=client,
             )
         except Exception:
             logger.warning("Failed to fetch posts for %s", username, exc_info=True)
             return None
 
     async def _fetch_comments(
-        self, username: str, headers: dict[str, str], timeout: float
+        self,
+        client: httpx.AsyncClient,
+        username: str,
+        headers: dict[str, str],
+        timeout: float,
     ) -> dict[str, Any] | None:
         try:
             return await fetch_json(
@@ -119,6 +147,7 @@ class RedditScraper(BaseScraper):
                 headers=headers,
                 params={"limit": 10, "sort": "top", "t": "all"},
                 timeout=timeout,
+                client=client,
             )
         except Exception:
             logger.warning("Failed to fetch comments for %s", username, exc_info=True)
@@ -130,33 +159,22 @@ class RedditScraper(BaseScraper):
 
     @staticmethod
     def _build_profile_items(about: dict[str, Any]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
         user_data = about.get("data", {})
         profile_url = f"https://www.reddit.com/user/{user_data.get('name', '')}"
 
-        field_map: dict[str, str] = {
-            "name": "username",
-            "link_karma": "link_karma",
-            "comment_karma": "comment_karma",
-            "total_karma": "total_karma",
-            "created_utc": "account_created",
-        }
-        for api_key, item_key in field_map.items():
-            val = user_data.get(api_key)
-            if val is not None and val != "":
-                items.append(
-                    ScrapedItem(category="profile", key=item_key, value=val, url=profile_url)
-                )
-        return items
+        return [
+            ScrapedItem(category="profile", key=item_key, value=val, url=profile_url)
+            for api_key, item_key in _PROFILE_FIELDS
+            if (val := user_data.get(api_key)) is not None and val != ""
+        ]
 
     @staticmethod
     def _build_post_items(posts: dict[str, Any]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
         children = posts.get("data", {}).get("children", [])
+        items: list[ScrapedItem] = []
         for child in children:
             post_data = child.get("data", {})
-            title = post_data.get("title", "")
-            if title:
+            if title := post_data.get("title", ""):
                 items.append(
                     ScrapedItem(
                         category="post",
@@ -173,23 +191,22 @@ class RedditScraper(BaseScraper):
 
     @staticmethod
     def _build_comment_items(comments: dict[str, Any]) -> list[ScrapedItem]:
-        items: list[ScrapedItem] = []
         children = comments.get("data", {}).get("children", [])
-        subreddit_counts: dict[str, int] = {}
-
+        subreddit_counts: Counter[str] = Counter()
         for child in children:
-            comment_data = child.get("data", {})
-            subreddit = comment_data.get("subreddit")
+            try:
+                subreddit = child["data"]["subreddit"]
+            except (KeyError, TypeError):
+                continue
             if subreddit:
-                subreddit_counts[subreddit] = subreddit_counts.get(subreddit, 0) + 1
-
-        for subreddit, count in sorted(subreddit_counts.items(), key=lambda x: x[1], reverse=True):
-            items.append(
-                ScrapedItem(
-                    category="activity",
-                    key=f"comments_in_{subreddit}",
-                    value=count,
-                    url=f"https://www.reddit.com/r/{subreddit}",
-                )
+                subreddit_counts[subreddit] += 1
+
+        return [
+            ScrapedItem(
+                category="activity",
+                key=f"comments_in_{subreddit}",
+                value=count,
+                url=f"https://www.reddit.com/r/{subreddit}",
             )
-        return items
+            for subreddit, count in subreddit_counts.most_common()
+        ]
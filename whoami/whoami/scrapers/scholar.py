@@ -3,16 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
-from functools import partial
-from typing import Any
-from urllib.parse import parse_qs, urlparse
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, ClassVar
+from urllib.parse import unquote_plus
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.url import parse_url
 
 logger = logging.getLogger(__name__)
 
+# First non-empty ``user=`` value in a query string.
+_USER_PARAM_RE = re.compile(r"(?:^|&)user=([^&]+)")
+
+# Author and publication fields read by the item builders and _safe_raw.
+_AUTHOR_FIELDS = (
+    "name", "affiliation", "email_domain", "interests",
+    "citedby", "hindex", "i10index", "scholar_id",
+)
+_PUBLICATION_BIB_FIELDS = ("title", "pub_year", "citation")
+
 
 class GoogleScholarScraper(BaseScraper):
     """Scrape Google Scholar author profiles via scholarly."""
@@ -22,6 +36,12 @@ class GoogleScholarScraper(BaseScraper):
         "scholar.google.com.*/citations*",
     ]
 
+    # scholarly blocks; give it its own small pool so it neither starves the
+    # default executor nor fans out into Scholar's rate limits.
+    _executor: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=4, thread_name_prefix="scholar",
+    )
+
     def get_platform_name(self) -> str:
         return "Google Scholar"
 
@@ -30,13 +50,13 @@ class GoogleScholarScraper(BaseScraper):
         loop = asyncio.get_running_loop()
         try:
             filled = await loop.run_in_executor(
-                None, partial(self._fetch_author, author_id)
+                self._executor, self._fetch_author, author_id, config.max_items
             )
         except Exception:
             logger.warning("Failed to fetch scholar %s", author_id, exc_info=True)
             return ScrapedData(platform=self.get_platform_name(), source_url=url)
 
-        items = self._build_items(filled, url, config.max_items)
+        items, raw_pubs = self._build_items(filled, url, config.max_items)
         bio = filled.get("affiliation")
 
         return ScrapedData(
@@ -44,7 +64,7 @@ class GoogleScholarScraper(BaseScraper):
             username=filled.get("name"),
             bio=bio,
             items=items,
-            raw=self._safe_raw(filled),
+            raw=self._safe_raw(filled, raw_pubs),
             source_url=url,
         )
 
@@ -54,25 +74,55 @@ class GoogleScholarScraper(BaseScraper):
 
     @staticmethod
     def _extract_author_id(url: str) -> str:
-        parsed = urlparse(url if "://" in url else f"https://{url}")
-        qs = parse_qs(parsed.query)
-        ids = qs.get("user", [])
-        if not ids:
+        m = _USER_PARAM_RE.search(parse_url(url).query)
+        if not m:
             raise ValueError(f"Cannot extract author ID from URL: {url}")
-        return ids[0]
+        return unquote_plus(m.group(1))
 
     # ------------------------------------------------------------------
     # Data fetching (synchronous — run via executor)
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _fetch_author(author_id: str) -> dict[str, Any]:
+    def _fetch_author(author_id: str, max_pubs: int) -> dict[str, Any]:
+        """Fetch an author profile, as a copy the caller is free to modify."""
+        return copy.deepcopy(
+            GoogleScholarScraper._fetch_author_cached(author_id, max_pubs)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _fetch_author_cached(author_id: str, max_pubs: int) -> dict[str, Any]:
+        """Fetch and fill an author profile; successes are memoised per process.
+
+        Scholar scrapes are slow and rate-limited, so repeat lookups of the same
+        author are served from memory. Only the fields the scraper reads are
+        kept, and only the top ``max_pubs`` publications are paged in. The
+        result is shared between callers: never hand it out uncopied.
+        """
         from scholarly import scholarly
 
         author = scholarly.search_author_id(author_id)
-        return scholarly.fill(
-            author, sections=["basics", "indices", "counts", "publications"]
-        )
+        if max_pubs <= 0:
+            # publication_limit=0 means "no limit" to scholarly.
+            filled = scholarly.fill(author, sections=["basics", "indices", "counts"])
+        else:
+            filled = scholarly.fill(
+                author,
+                sections=["basics", "indices", "counts", "publications"],
+                publication_limit=max_pubs,
+            )
+
+        profile = {key: filled[key] for key in _AUTHOR_FIELDS if key in filled}
+        publications: list[dict[str, Any]] = []
+        for pub in filled.get("publications", []):
+            bib = pub.get("bib", {})
+            publications.append({
+                "bib": {key: bib[key] for key in _PUBLICATION_BIB_FIELDS if key in bib},
+                "num_citations": pub.get("num_citations", 0),
+            })
+        profile["publications"] = publications
+        return profile
 
     # ------------------------------------------------------------------
     # Item builders
@@ -81,7 +131,11 @@ class GoogleScholarScraper(BaseScraper):
     @staticmethod
     def _build_items(
         data: dict[str, Any], url: str, max_pubs: int
-    ) -> list[ScrapedItem]:
+    ) -> tuple[list[ScrapedItem], list[dict[str, Any]]]:
+        """Build items, plus the JSON-safe summary of every publication for raw.
+
+        Publications are walked once; only the first ``max_pubs`` become items.
+        """
         items: list[ScrapedItem] = []
 
         # Profile fields
@@ -110,40 +164,36 @@ class GoogleScholarScraper(BaseScraper):
             )
 
         # Publications
-        for pub in data.get("publications", [])[:max_pubs]:
+        raw_pubs: list[dict[str, Any]] = []
+        for i, pub in enumerate(data.get("publications", [])):
             bib = pub.get("bib", {})
-            title = bib.get("title", "untitled")
-            items.append(
-                ScrapedItem(
-                    category="publication",
-                    key=title,
-                    value={
-                        "year": bib.get("pub_year"),
-                        "venue": bib.get("citation", ""),
-                        "citations": pub.get("num_citations", 0),
-                    },
-                    url=url,
-                )
+            title = bib.get("title")
+            year = bib.get("pub_year")
+            venue = bib.get("citation", "")
+            citations = pub.get("num_citations", 0)
+            raw_pubs.append(
+                {"title": title, "year": year, "venue": venue, "citations": citations}
             )
+            if i < max_pubs:
+                items.append(
+                    ScrapedItem(
+                        category="publication",
+                        key=bib.get("title", "untitled"),
+                        value={"year": year, "venue": venue, "citations": citations},
+                        url=url,
+                    )
+                )
 
-        return items
+        return items, raw_pubs
 
     @staticmethod
-    def _safe_raw(data: dict[str, Any]) -> dict[str, Any]:
+    def _safe_raw(
+        data: dict[str, Any], publications: list[dict[str, Any]]
+    ) -> dict[str, Any]:
         """Extract JSON-serializable fields for raw storage."""
         safe: dict[str, Any] = {}
-        for key in ("name", "affiliation", "interests", "email_domain",
-                     "citedby", "hindex", "i10index", "scholar_id"):
+        for key in _AUTHOR_FIELDS:
             if key in data:
                 safe[key] = data[key]
-        pubs = []
-        for pub in data.get("publications", []):
-            bib = pub.get("bib", {})
-            pubs.append({
-                "title": bib.get("title"),
-                "year": bib.get("pub_year"),
-                "venue": bib.get("citation", ""),
-                "citations": pub.get("num_citations", 0),
-            })
-        safe["publications"] = pubs
+        safe["publications"] = publications
         return safe
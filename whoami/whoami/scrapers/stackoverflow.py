@@ -6,22 +6,25 @@ import asyncio
 import logging
 import re
 from typing import Any
-from urllib.parse import urlparse
 
 import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.http import client_for, fetch_json
+from whoami.utils.url import parse_url
 
 logger = logging.getLogger(__name__)
 
 _API_BASE = "https://api.stackexchange.com/2.3"
+_USER_PATH_RE = re.compile(r"/*users/+(\d+)(?:/|$)")
 
 
 class StackOverflowScraper(BaseScraper):
     """Scrape public Stack Overflow profiles via the Stack Exchange API."""
 
     url_patterns: list[str] = ["stackoverflow.com/*"]
+    hosts: tuple[str, ...] = ("stackoverflow.com",)
 
     def get_platform_name(self) -> str:
         return "Stack Overflow"
@@ -35,11 +38,12 @@ class StackOverflowScraper(BaseScraper):
         timeout = config.timeout
 
         # Fetch user info, top tags, and top answers concurrently
-        user_data, tags_data, answers_data = await asyncio.gather(
-            self._fetch_user(user_id, timeout),
-            self._fetch_top_tags(user_id, timeout),
-            self._fetch_top_answers(user_id, timeout, config.max_items),
-        )
+        async with client_for(config) as client:
+            user_data, tags_data, answers_data = await asyncio.gather(
+                self._fetch_user(client, user_id, timeout),
+                self._fetch_top_tags(client, user_id, timeout),
+                self._fetch_top_answers(client, user_id, timeout, config.max_items),
+            )
 
         items: list[ScrapedItem] = []
 
@@ -64,7 +68,11 @@ class StackOverflowScraper(BaseScraper):
             username=username,
             bio=bio,
             items=items,
-            raw={"user": user_data or {}, "tags": tags_data or [], "answers": answers_data or []},
+            raw=(
+                {"user": user_data or {}, "tags": tags_data or [], "answers": answers_data or []}
+                if config.extra.get("include_raw", False)
+                else {}
+            ),
             source_url=url,
         )
 
@@ -78,14 +86,10 @@ class StackOverflowScraper(BaseScraper):
 
         Example: https://stackoverflow.com/users/22656/jon-skeet -> 22656
         """
-        parsed = urlparse(url if "://" in url else f"https://{url}")
-        parts = [p for p in parsed.path.strip("/").split("/") if p]
-
         # URL format: /users/{id}/{username}
-        if len(parts) >= 2 and parts[0] == "users":
-            user_id = parts[1]
-            if user_id.isdigit():
-                return user_id
+        m = _USER_PATH_RE.match(parse_url(url).path)
+        if m:
+            return m.group(1)
 
         raise ValueError(f"Cannot extract Stack Overflow user ID from URL: {url}")
 
@@ -93,67 +97,52 @@ class StackOverflowScraper(BaseScraper):
     # API fetchers (each returns None on failure for graceful degradation)
     # ------------------------------------------------------------------
 
-    async def _fetch_user(self, user_id: str, timeout: float) -> dict[str, Any] | None:
-        """Fetch user profile information."""
+    async def _fetch_items(
+        self,
+        client: httpx.AsyncClient,
+        path: str,
+        params: dict[str, Any],
+        timeout: float,
+    ) -> list[dict[str, Any]] | None:
+        """GET an API path and return its non-empty ``items`` list, or None."""
         try:
-            url = f"{_API_BASE}/users/{user_id}"
-            params = {"site": "stackoverflow"}
-
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-
-                if data.get("items"):
-                    return data["items"][0]
-                return None
+            data = await fetch_json(
+                f"{_API_BASE}/{path}", params=params, timeout=timeout, client=client
+            )
+            return data.get("items") or None
         except Exception:
-            logger.warning("Failed to fetch user profile for %s", user_id, exc_info=True)
+            logger.warning("Failed to fetch %s", path, exc_info=True)
             return None
 
-    async def _fetch_top_tags(self, user_id: str, timeout: float) -> list[dict[str, Any]] | None:
-        """Fetch user's top tags."""
-        try:
-            url = f"{_API_BASE}/users/{user_id}/top-tags"
-            params = {"site": "stackoverflow", "pagesize": 10}
-
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                data = resp.json()
+    async def _fetch_user(
+        self, client: httpx.AsyncClient, user_id: str, timeout: float
+    ) -> dict[str, Any] | None:
+        """Fetch user profile information."""
+        items = await self._fetch_items(
+            client, f"users/{user_id}", {"site": "stackoverflow"}, timeout,
+        )
+        return items[0] if items else None
 
-                if data.get("items"):
-                    return data["items"]
-                return None
-        except Exception:
-            logger.warning("Failed to fetch top tags for %s", user_id, exc_info=True)
-            return None
+    async def _fetch_top_tags(
+        self, client: httpx.AsyncClient, user_id: str, timeout: float
+    ) -> list[dict[str, Any]] | None:
+        """Fetch user's top tags."""
+        return await self._fetch_items(
+            client, f"users/{user_id}/top-tags", {"site": "stackoverflow", "pagesize": 10},
+            timeout,
+        )
 
     async def _fetch_top_answers(
-        self, user_id: str, timeout: float, max_items: int
+        self, client: httpx.AsyncClient, user_id: str, timeout: float, max_items: int
     ) -> list[dict[str, Any]] | None:
         """Fetch user's top answers by votes."""
-        try:
-            url = f"{_API_BASE}/users/{user_id}/answers"
-            pagesize = min(max_items, 10)
-            params = {
-                "site": "stackoverflow",
-                "order": "desc",
-                "sort": "votes",
-                "pagesize": pagesize,
-            }
-
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-
-                if data.get("items"):
-                    return data["items"]
-                return None
-        except Exception:
-            logger.warning("Failed to fetch top answers for %s", user_id, exc_info=True)
-            return None
+        params = {
+            "site": "stackoverflow",
+            "order": "desc",
+            "sort": "votes",
+            "pagesize": min(max_items, 10),
+        }
+        return await self._fetch_items(client, f"users/{user_id}/answers", params, timeout)
 
     # ------------------------------------------------------------------
     # Item builders
@@ -8,7 +8,31 @@ from urllib.parse import urlparse
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
-from whoami.utils.http import fetch_text
+from whoami.utils.http import client_for, fetch_bytes
+
+# A <br> (group 1, kept as a newline) or any other tag (dropped).
+_TAG_RE = re.compile(rb"<(?:(br\s*/?)|[^>]+)>")
+_USERNAME_RE = re.compile(rb'<span class="actual_persona_name">(.*?)</span>')
+_BIO_RE = re.compile(rb'<div class="profile_summary[^"]*"[^>]*>(.*?)</div>', re.DOTALL)
+_REAL_NAME_RE = re.compile(rb"header_real_name[^>]*>.*?<bdi>(.*?)</bdi>", re.DOTALL)
+_LOCATION_RE = re.compile(rb'<div class="header_location">(.*?)</div>', re.DOTALL)
+_LEVEL_RE = re.compile(rb'<span class="friendPlayerLevelNum">(\d+)</span>')
+# Badge tooltip ("104 games owned") or, failing that, the profile count link.
+_GAME_COUNT_RE = re.compile(
+    rb"(\d+)\s+games?\s+owned"
+    rb'|Games</span>\s*&nbsp;\s*<span class="profile_count_link_total">\s*(\d+)',
+    re.DOTALL,
+)
+_RECENT_GAME_RE = re.compile(
+    rb'<div class="recent_game">(.*?)</div>\s*</div>\s*</div>', re.DOTALL
+)
+_GAME_NAME_RE = re.compile(rb'class="game_name"[^>]*>\s*<a[^>]*>(.*?)</a>', re.DOTALL)
+_HOURS_RE = re.compile(rb"([\d,.]+)\s+hrs?\s+on\s+record")
+_GAME_URL_RE = re.compile(rb'href="(https://steamcommunity\.com/app/\d+)"')
+
+
+def _tag_replacement(m: re.Match[bytes]) -> bytes:
+    return b"\n" if m.group(1) is not None else b""
 
 
 class SteamScraper(BaseScraper):
@@ -18,19 +42,22 @@ class SteamScraper(BaseScraper):
         "store.steampowered.com/*",
         "steamcommunity.com/*",
     ]
+    hosts: tuple[str, ...] = ("store.steampowered.com", "steamcommunity.com")
 
     def get_platform_name(self) -> str:
         return "Steam"
 
     async def scrape(self, url: str, config: ScraperConfig) -> ScrapedData:
         profile_url = self._resolve_profile_url(url)
-        raw_html = await fetch_text(profile_url, timeout=config.timeout)
+        async with client_for(config) as client:
+            # Matched on bytes; only the extracted fragments are decoded.
+            raw_html = await fetch_bytes(profile_url, timeout=config.timeout, client=client)
 
         username = self._parse_username(raw_html)
-        bio = self._parse_bio(raw_html)
         items: list[ScrapedItem] = []
 
-        if "This profile is private" in raw_html:
+        # Private profiles expose only the persona name; skip the other parsers.
+        if b"This profile is private" in raw_html:
             items.append(
                 ScrapedItem(
                     category="profile",
@@ -47,6 +74,8 @@ class SteamScraper(BaseScraper):
                 source_url=profile_url,
             )
 
+        bio = self._parse_bio(raw_html)
+
         # Real name and location
         real_name = self._parse_real_name(raw_html)
         if real_name:
@@ -125,102 +154,69 @@ class SteamScraper(BaseScraper):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _strip_tags(text: str) -> str:
-        """Remove HTML tags and decode entities."""
-        text = re.sub(r"<br\s*/?>", "\n", text)
-        text = re.sub(r"<[^>]+>", "", text)
-        text = html_mod.unescape(text)
-        return text.strip()
-
-    def _parse_username(self, raw_html: str) -> str | None:
-        m = re.search(
-            r'<span class="actual_persona_name">(.*?)</span>', raw_html
-        )
+    def _strip_tags(fragment: bytes) -> str:
+        """Remove HTML tags, decode the UTF-8 fragment and its entities."""
+        text = _TAG_RE.sub(_tag_replacement, fragment).decode("utf-8", errors="replace")
+        return html_mod.unescape(text).strip()
+
+    def _parse_username(self, raw_html: bytes) -> str | None:
+        m = _USERNAME_RE.search(raw_html)
         return self._strip_tags(m.group(1)) if m else None
 
-    def _parse_bio(self, raw_html: str) -> str | None:
-        m = re.search(
-            r'<div class="profile_summary[^"]*"[^>]*>(.*?)</div>',
-            raw_html,
-            re.DOTALL,
-        )
+    def _parse_bio(self, raw_html: bytes) -> str | None:
+        m = _BIO_RE.search(raw_html)
         if not m:
             return None
         text = self._strip_tags(m.group(1))
         return text if text else None
 
-    def _parse_real_name(self, raw_html: str) -> str | None:
-        m = re.search(
-            r'header_real_name[^>]*>.*?<bdi>(.*?)</bdi>',
-            raw_html,
-            re.DOTALL,
-        )
+    def _parse_real_name(self, raw_html: bytes) -> str | None:
+        m = _REAL_NAME_RE.search(raw_html)
         return self._strip_tags(m.group(1)) if m else None
 
-    def _parse_location(self, raw_html: str) -> str | None:
-        m = re.search(
-            r'<div class="header_location">(.*?)</div>',
-            raw_html,
-            re.DOTALL,
-        )
+    def _parse_location(self, raw_html: bytes) -> str | None:
+        m = _LOCATION_RE.search(raw_html)
         if not m:
             return None
         text = self._strip_tags(m.group(1))
         return text if text else None
 
-    def _parse_level(self, raw_html: str) -> int | None:
-        m = re.search(
-            r'<span class="friendPlayerLevelNum">(\d+)</span>', raw_html
-        )
-        return int(m.group(1)) if m else None
-
-    def _parse_game_count(self, raw_html: str) -> int | None:
-        # Appears in badge tooltip: "104 games owned"
-        m = re.search(r"(\d+)\s+games?\s+owned", raw_html)
-        if m:
-            return int(m.group(1))
-        # Fallback: profile count link
-        m = re.search(
-            r'Games</span>\s*&nbsp;\s*<span class="profile_count_link_total">'
-            r"\s*(\d+)",
-            raw_html,
-            re.DOTALL,
-        )
+    def _parse_level(self, raw_html: bytes) -> int | None:
+        m = _LEVEL_RE.search(raw_html)
         return int(m.group(1)) if m else None
 
-    def _parse_recent_games(self, raw_html: str) -> list[dict[str, str]]:
+    def _parse_game_count(self, raw_html: bytes) -> int | None:
+        # One pass: the badge tooltip wins wherever it appears; the first
+        # profile count link is kept as the fallback.
+        fallback: bytes | None = None
+        for m in _GAME_COUNT_RE.finditer(raw_html):
+            if m.group(1):
+                return int(m.group(1))
+            if fallback is None:
+                fallback = m.group(2)
+        return int(fallback) if fallback is not None else None
+
+    def _parse_recent_games(self, raw_html: bytes) -> list[dict[str, str]]:
         games: list[dict[str, str]] = []
         # Each recent game lives in a <div class="recent_game"> block
-        for block in re.finditer(
-            r'<div class="recent_game">(.*?)</div>\s*</div>\s*</div>',
-            raw_html,
-            re.DOTALL,
-        ):
+        for block in _RECENT_GAME_RE.finditer(raw_html):
             content = block.group(1)
             game: dict[str, str] = {}
 
             # Game name: <a ...>Name</a> inside game_name div
-            name_m = re.search(
-                r'class="game_name"[^>]*>\s*<a[^>]*>(.*?)</a>',
-                content,
-                re.DOTALL,
-            )
+            name_m = _GAME_NAME_RE.search(content)
             if name_m:
                 game["name"] = self._strip_tags(name_m.group(1))
 
             # Hours played
-            hours_m = re.search(
-                r'([\d,.]+)\s+hrs?\s+on\s+record', content
-            )
+            hours_m = _HOURS_RE.search(content)
             if hours_m:
-                game["hours"] = hours_m.group(1)
+                game["hours"] = hours_m.group(1).decode("ascii")
 
             # Game URL from capsule link
-            url_m = re.search(
-                r'href="(https://steamcommunity\.com/app/\d+)"', content
-            )
+            url_m = _GAME_URL_RE.search(content)
             if url_m:
-                game["url"] = url_m.group(1)
+                game["url"] = url_m.group(1).decode("ascii")
 
             if game.get("name"):
                 games.append(game)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import Any
@@ -10,6 +11,7 @@ import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.http import client_for, parse_json
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,18 @@ _WEIBO_HEADERS: dict[str, str] = {
     "Referer": "https://m.weibo.cn/",
     "Accept": "application/json, text/plain, */*",
 }
+# Head start given to the mobile API before the ajax API is raced against it.
+_HEDGE_DELAY = 2.0
+
+# The desktop ajax endpoint wants a desktop UA; only Referer varies per user.
+_WEIBO_AJAX_HEADERS: dict[str, str] = {
+    **_WEIBO_HEADERS,
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/125.0.0.0 Safari/537.36"
+    ),
+}
 
 
 def _extract_uid(url: str) -> str | None:
@@ -37,57 +51,52 @@ def _extract_uid(url: str) -> str | None:
     return None
 
 
-def _parse_mobile_api(data: dict[str, Any]) -> tuple[
-    str | None, str | None, list[ScrapedItem], dict[str, Any],
-]:
+# (source key, item category, item key), shared by both API response shapes.
+_USER_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("verified", "profile", "verified"),
+    ("verified_type", "profile", "verified_type"),
+    ("verified_reason", "profile", "verified_reason"),
+    ("followers_count", "stats", "followers"),
+    ("follow_count", "stats", "following"),
+    ("statuses_count", "stats", "posts"),
+)
+
+
+def _build_user_items(user: dict[str, Any], avatar_key: str) -> list[ScrapedItem]:
+    """Build profile/stats items from a Weibo user object."""
+    items: list[ScrapedItem] = []
+    if avatar := user.get(avatar_key):
+        items.append(ScrapedItem(category="profile", key="avatar", value=avatar))
+    items.extend(
+        ScrapedItem(category=category, key=item_key, value=value)
+        for src_key, category, item_key in _USER_FIELDS
+        if (value := user.get(src_key))
+    )
+    return items
+
+
+_ParsedUser = tuple[str | None, str | None, list[ScrapedItem], dict[str, Any]]
+
+
+def _has_user(result: _ParsedUser | None) -> bool:
+    return result is not None and bool(result[0])
+
+
+def _parse_mobile_api(data: dict[str, Any]) -> _ParsedUser:
     """Parse mobile API response from m.weibo.cn."""
     userInfo = data.get("data", {}).get("userInfo", {})
     username = userInfo.get("screen_name")
     bio = userInfo.get("description") or None
-    items: list[ScrapedItem] = []
-
-    if avatar := userInfo.get("profile_image_url"):
-        items.append(ScrapedItem(category="profile", key="avatar", value=avatar))
-    if verified := userInfo.get("verified"):
-        items.append(ScrapedItem(category="profile", key="verified", value=verified))
-    if verified_type := userInfo.get("verified_type"):
-        items.append(ScrapedItem(category="profile", key="verified_type", value=verified_type))
-    if verified_reason := userInfo.get("verified_reason"):
-        items.append(ScrapedItem(category="profile", key="verified_reason", value=verified_reason))
-    if followers := userInfo.get("followers_count"):
-        items.append(ScrapedItem(category="stats", key="followers", value=followers))
-    if following := userInfo.get("follow_count"):
-        items.append(ScrapedItem(category="stats", key="following", value=following))
-    if posts := userInfo.get("statuses_count"):
-        items.append(ScrapedItem(category="stats", key="posts", value=posts))
-
+    items = _build_user_items(userInfo, "profile_image_url")
     return username, bio, items, userInfo
 
 
-def _parse_ajax_api(data: dict[str, Any]) -> tuple[
-    str | None, str | None, list[ScrapedItem], dict[str, Any],
-]:
+def _parse_ajax_api(data: dict[str, Any]) -> _ParsedUser:
     """Parse ajax API response from weibo.com/ajax."""
     user_data = data.get("data", {})
     username = user_data.get("screen_name")
     bio = user_data.get("description") or None
-    items: list[ScrapedItem] = []
-
-    if avatar := user_data.get("avatar_hd"):
-        items.append(ScrapedItem(category="profile", key="avatar", value=avatar))
-    if verified := user_data.get("verified"):
-        items.append(ScrapedItem(category="profile", key="verified", value=verified))
-    if verified_type := user_data.get("verified_type"):
-        items.append(ScrapedItem(category="profile", key="verified_type", value=verified_type))
-    if verified_reason := user_data.get("verified_reason"):
-        items.append(ScrapedItem(category="profile", key="verified_reason", value=verified_reason))
-    if followers := user_data.get("followers_count"):
-        items.append(ScrapedItem(category="stats", key="followers", value=followers))
-    if following := user_data.get("follow_count"):
-        items.append(ScrapedItem(category="stats", key="following", value=following))
-    if posts := user_data.get("statuses_count"):
-        items.append(ScrapedItem(category="stats", key="posts", value=posts))
-
+    items = _build_user_items(user_data, "avatar_hd")
     return username, bio, items, user_data
 
 
@@ -95,6 +104,7 @@ class WeiboScraper(BaseScraper):
     """Scraper for Weibo user profiles."""
 
     url_patterns: list[str] = ["*weibo.com/*"]
+    hosts: tuple[str, ...] = ("weibo.com",)
 
     def get_platform_name(self) -> str:
         return "Weibo"
@@ -114,62 +124,39 @@ class WeiboScraper(BaseScraper):
         username: str | None = None
         bio: str | None = None
         raw: dict[str, Any] = {}
-
-        async with httpx.AsyncClient(
-            timeout=config.timeout, follow_redirects=True,
-        ) as client:
-            # Try mobile API with containerid (more reliable)
-            try:
-                containerid = f"100505{uid}"
-                resp = await client.get(
-                    "https://m.weibo.cn/api/container/getIndex",
-                    headers=_WEIBO_HEADERS,
-                    params={"containerid": containerid},
-                )
-                mobile_data = resp.json()
-                if mobile_data.get("ok") == 1:
-                    username, bio, profile_items, user_raw = _parse_mobile_api(
-                        mobile_data,
-                    )
-                    items.extend(profile_items)
-                    raw["mobile_api"] = user_raw
-                    logger.debug("Mobile API succeeded for uid=%s", uid)
-            except httpx.HTTPStatusError as exc:
-                logger.debug("Mobile API HTTP error: %s", exc)
-                raw["mobile_api_error"] = f"HTTP {exc.response.status_code}"
-            except Exception as exc:
-                logger.debug("Mobile API failed: %s", exc)
-                raw["mobile_api_error"] = str(exc)
-
-            # Fallback to ajax API if mobile API failed or returned no data
-            if not username:
-                try:
-                    resp = await client.get(
-                        "https://weibo.com/ajax/profile/info",
-                        headers={
-                            **_WEIBO_HEADERS,
-                            "User-Agent": (
-                                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                                "Chrome/125.0.0.0 Safari/537.36"
-                            ),
-                            "Referer": f"https://weibo.com/u/{uid}",
-                        },
-                        params={"uid": uid},
+        include_raw = config.extra.get("include_raw", False)
+
+        async with client_for(config) as client:
+            # Mobile API first (more reliable); if it is slow or comes back
+            # without a user, race the ajax API against it.
+            attempts = {"mobile_api": asyncio.create_task(self._try_mobile(client, uid, config.timeout, raw))}
+            done, _ = await asyncio.wait(
+                attempts.values(), timeout=min(_HEDGE_DELAY, config.timeout / 2),
+            )
+            if not done or not _has_user(attempts["mobile_api"].result()):
+                attempts["ajax_api"] = asyncio.create_task(self._try_ajax(client, uid, config.timeout, raw))
+                pending = {t for t in attempts.values() if not t.done()}
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED,
                     )
-                    ajax_data = resp.json()
-                    if ajax_data.get("ok") == 1:
-                        username, bio, profile_items, user_raw = _parse_ajax_api(
-                            ajax_data,
-                        )
-                        items.extend(profile_items)
-                        raw["ajax_api"] = user_raw
-                        logger.debug("Ajax API succeeded for uid=%s", uid)
-                    else:
-                        raw["ajax_api_error"] = f"API returned ok={ajax_data.get('ok')}"
-                except Exception as exc:
-                    logger.debug("Ajax API failed: %s", exc)
-                    raw["ajax_api_error"] = str(exc)
+                    if any(_has_user(t.result()) for t in done):
+                        break
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            # Merge in mobile-then-ajax order, as the sequential fallback did:
+            # the first result that names the user ends the merge.
+            for key, task in attempts.items():
+                if task.cancelled() or (result := task.result()) is None:
+                    continue
+                username, bio, profile_items, user_raw = result
+                items.extend(profile_items)
+                if include_raw:
+                    raw[key] = user_raw
+                if username:
+                    break
 
             # If both APIs failed, add a helpful message
             if not username and not items:
@@ -186,3 +173,51 @@ class WeiboScraper(BaseScraper):
             raw=raw,
             source_url=url,
         )
+
+    # ------------------------------------------------------------------
+    # API attempts (each records its error in *raw* and returns None)
+    # ------------------------------------------------------------------
+
+    async def _try_mobile(
+        self, client: httpx.AsyncClient, uid: str, timeout: float,
+        raw: dict[str, Any],
+    ) -> _ParsedUser | None:
+        try:
+            resp = await client.get(
+                "https://m.weibo.cn/api/container/getIndex",
+                headers=_WEIBO_HEADERS,
+                params={"containerid": f"100505{uid}"},
+                timeout=timeout,
+            )
+            mobile_data = parse_json(resp)
+            if mobile_data.get("ok") == 1:
+                logger.debug("Mobile API succeeded for uid=%s", uid)
+                return _parse_mobile_api(mobile_data)
+        except httpx.HTTPStatusError as exc:
+            logger.debug("Mobile API HTTP error: %s", exc)
+            raw["mobile_api_error"] = f"HTTP {exc.response.status_code}"
+        except Exception as exc:
+            logger.debug("Mobile API failed: %s", exc)
+            raw["mobile_api_error"] = str(exc)
+        return None
+
+    async def _try_ajax(
+        self, client: httpx.AsyncClient, uid: str, timeout: float,
+        raw: dict[str, Any],
+    ) -> _ParsedUser | None:
+        try:
+            resp = await client.get(
+                "https://weibo.com/ajax/profile/info",
+                headers=_WEIBO_AJAX_HEADERS | {"Referer": f"https://weibo.com/u/{uid}"},
+                params={"uid": uid},
+                timeout=timeout,
+            )
+            ajax_data = parse_json(resp)
+            if ajax_data.get("ok") == 1:
+                logger.debug("Ajax API succeeded for uid=%s", uid)
+                return _parse_ajax_api(ajax_data)
+            raw["ajax_api_error"] = f"API returned ok={ajax_data.get('ok')}"
+        except Exception as exc:
+            logger.debug("Ajax API failed: %s", exc)
+            raw["ajax_api_error"] = str(exc)
+        return None
@@ -2,15 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from typing import Any
 
-import httpx
-
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.http import client_for, loads_json
 
 logger = logging.getLogger(__name__)
 
@@ -25,34 +23,66 @@ _XHS_HEADERS: dict[str, str] = {
     "Referer": "https://www.xiaohongshu.com/",
 }
 
+_USER_ID_RE = re.compile(r"xiaohongshu\.com/user/profile/([a-zA-Z0-9]+)")
+_INITIAL_STATE_MARKER = b"window.__INITIAL_STATE__"
+_UNDEFINED_RE = re.compile(rb"\bundefined\b")
+
 
 def _extract_user_id(url: str) -> str | None:
     """Extract user ID from a Xiaohongshu URL."""
-    m = re.search(r"xiaohongshu\.com/user/profile/([a-zA-Z0-9]+)", url)
+    m = _USER_ID_RE.search(url)
     if m:
         return m.group(1)
     return None
 
 
-def _parse_initial_state(html: str) -> dict[str, Any] | None:
-    """Extract __INITIAL_STATE__ JSON from the HTML page."""
-    m = re.search(
-        r"window\.__INITIAL_STATE__\s*=\s*({.+?})\s*</script>",
-        html,
-        re.DOTALL,
-    )
-    if not m:
+def _find_initial_state(page: bytes) -> bytes | None:
+    """Return the object literal assigned to __INITIAL_STATE__, if any.
+
+    Works on the raw body with plain substring searches: pages run to
+    megabytes and the script body is the only part that needs decoding.
+    """
+    start = page.find(_INITIAL_STATE_MARKER)
+    while start != -1:
+        end = page.find(b"</script>", start)
+        if end == -1:
+            return None
+        rest = page[start + len(_INITIAL_STATE_MARKER):end].lstrip()
+        if rest.startswith(b"="):
+            body = rest[1:].strip()
+            if body.startswith(b"{") and body.endswith(b"}"):
+                return body
+        start = page.find(_INITIAL_STATE_MARKER, end)
+    return None
+
+
+def _parse_initial_state(page: bytes) -> dict[str, Any] | None:
+    """Extract __INITIAL_STATE__ JSON from the undecoded HTML page."""
+    raw = _find_initial_state(page)
+    if raw is None:
         return None
-    raw = m.group(1)
     # Xiaohongshu uses `undefined` in JSON which is invalid — replace with null
-    raw = re.sub(r"\bundefined\b", "null", raw)
+    # (only when present: the rewrite copies the whole, often multi-MB, blob)
+    if b"undefined" in raw:
+        raw = _UNDEFINED_RE.sub(b"null", raw)
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
+        return loads_json(raw)
+    except ValueError:
         logger.debug("Failed to parse __INITIAL_STATE__ JSON")
         return None
 
 
+_GENDER_LABELS: dict[str, str] = {"0": "male", "1": "female"}
+
+# (source key, item key) for counters, which are reported even when zero.
+_STATS_FIELDS: tuple[tuple[str, str], ...] = (
+    ("fans", "followers"),
+    ("follows", "following"),
+    ("collected", "likes_collected"),
+    ("liked", "likes"),
+)
+
+
 def _build_items(user: dict[str, Any]) -> list[ScrapedItem]:
     """Build ScrapedItem list from user data dict."""
     items: list[ScrapedItem] = []
@@ -62,17 +92,14 @@ def _build_items(user: dict[str, Any]) -> list[ScrapedItem]:
     if location := user.get("ipLocation"):
         items.append(ScrapedItem(category="profile", key="location", value=location))
     if gender := user.get("gender"):
-        label = {"0": "male", "1": "female"}.get(str(gender), str(gender))
+        label = _GENDER_LABELS.get(str(gender), str(gender))
         items.append(ScrapedItem(category="profile", key="gender", value=label))
 
-    if (fans := user.get("fans")) is not None:
-        items.append(ScrapedItem(category="stats", key="followers", value=fans))
-    if (follows := user.get("follows")) is not None:
-        items.append(ScrapedItem(category="stats", key="following", value=follows))
-    if (collected := user.get("collected")) is not None:
-        items.append(ScrapedItem(category="stats", key="likes_collected", value=collected))
-    if (liked := user.get("liked")) is not None:
-        items.append(ScrapedItem(category="stats", key="likes", value=liked))
+    items.extend(
+        ScrapedItem(category="stats", key=item_key, value=value)
+        for src_key, item_key in _STATS_FIELDS
+        if (value := user.get(src_key)) is not None
+    )
 
     # Tags / interests
     for tag in user.get("tags") or []:
@@ -122,6 +149,7 @@ class XiaohongshuScraper(BaseScraper):
         "*xiaohongshu.com/user/profile/*",
         "*xhslink.com/*",
     ]
+    hosts: tuple[str, ...] = ("xiaohongshu.com", "xhslink.com")
 
     def get_platform_name(self) -> str:
         return "Xiaohongshu"
@@ -140,13 +168,13 @@ class XiaohongshuScraper(BaseScraper):
         profile_url = f"https://www.xiaohongshu.com/user/profile/{user_id}"
         raw: dict[str, Any] = {}
 
-        async with httpx.AsyncClient(
-            timeout=config.timeout, follow_redirects=True,
-        ) as client:
+        async with client_for(config) as client:
             try:
-                resp = await client.get(profile_url, headers=_XHS_HEADERS)
+                resp = await client.get(
+                    profile_url, headers=_XHS_HEADERS, timeout=config.timeout,
+                )
                 resp.raise_for_status()
-                html = resp.text
+                page = resp.content
             except Exception as exc:
                 logger.debug("Failed to fetch Xiaohongshu profile: %s", exc)
                 return ScrapedData(
@@ -155,7 +183,7 @@ class XiaohongshuScraper(BaseScraper):
                     raw={"error": str(exc)},
                 )
 
-        state = _parse_initial_state(html)
+        state = _parse_initial_state(page)
         if not state:
             return ScrapedData(
                 platform=self.get_platform_name(),
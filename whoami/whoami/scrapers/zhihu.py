@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
 from typing import Any
@@ -11,6 +11,7 @@ import httpx
 
 from whoami.models import ScrapedData, ScrapedItem, ScraperConfig
 from whoami.scrapers.base import BaseScraper
+from whoami.utils.http import client_for, loads_json, parse_json
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +24,58 @@ _ZHIHU_HEADERS: dict[str, str] = {
     "Referer": "https://www.zhihu.com/",
     "Accept": "application/json, text/plain, */*",
 }
+_ZHIHU_HTML_HEADERS: dict[str, str] = {
+    "User-Agent": _ZHIHU_HEADERS["User-Agent"],
+    "Accept": "text/html",
+}
+# Head start given to the API before the profile page is raced against it.
+_HEDGE_DELAY = 2.0
+
+_ZHIHU_API_PARAMS: dict[str, str] = {
+    "include": (
+        "locations,employments,gender,educations,business,"
+        "voteup_count,thanked_Count,follower_count,following_count,"
+        "cover_url,following_topic_count,following_question_count,"
+        "following_favlists_count,following_columns_count,"
+        "answer_count,articles_count,pins_count,question_count,"
+        "columns_count,commercial_question_count,favorite_count,"
+        "favorited_count,logs_count,marked_answers_count,"
+        "marked_answers_text,message_thread_token,account_status,"
+        "is_active,is_force_renamed,is_bind_sina,sina_weibo_url,"
+        "sina_weibo_name,show_sina_weibo,is_blocking,is_blocked,"
+        "is_following,is_followed,mutual_followees_count,"
+        "vote_to_count,vote_from_count,thank_to_count,"
+        "thank_from_count,thanked_count,description,hosted_live_count,"
+        "participated_live_count,allow_message,industry_category,"
+        "org_name,org_homepage,badge[?(type=best_answerer)].topics"
+    ),
+}
+
+_URL_TOKEN_RE = re.compile(r"zhihu\.com/people/([^/?#]+)")
+_EMBEDDED_DATA_OPEN = '<script id="js-initialData" type="text/json">'
 
 
 def _extract_url_token(url: str) -> str | None:
     """Extract user URL token from a Zhihu URL."""
-    m = re.search(r"zhihu\.com/people/([^/?#]+)", url)
+    m = _URL_TOKEN_RE.search(url)
     if m:
         return m.group(1)
     return None
 
 
+_GENDER_LABELS: dict[int, str] = {-1: "unknown", 0: "female", 1: "male"}
+
+# (source key, item key) for the counters reported under "stats".
+_STATS_FIELDS: tuple[tuple[str, str], ...] = (
+    ("follower_count", "followers"),
+    ("following_count", "following"),
+    ("answer_count", "answers"),
+    ("articles_count", "articles"),
+    ("question_count", "questions"),
+    ("voteup_count", "total_upvotes"),
+)
+
+
 def _parse_api_response(data: dict[str, Any]) -> tuple[
     str | None, str | None, list[ScrapedItem],
 ]:
@@ -49,77 +92,49 @@ def _parse_api_response(data: dict[str, Any]) -> tuple[
         ))
 
     if gender := data.get("gender"):
-        gender_map = {-1: "unknown", 0: "female", 1: "male"}
         items.append(ScrapedItem(
             category="profile",
             key="gender",
-            value=gender_map.get(gender, "unknown"),
+            value=_GENDER_LABELS.get(gender, "unknown"),
         ))
 
-    if follower_count := data.get("follower_count"):
-        items.append(ScrapedItem(
-            category="stats",
-            key="followers",
-            value=follower_count,
-        ))
+    items.extend(
+        ScrapedItem(category="stats", key=item_key, value=value)
+        for src_key, item_key in _STATS_FIELDS
+        if (value := data.get(src_key))
+    )
 
-    if following_count := data.get("following_count"):
-        items.append(ScrapedItem(
-            category="stats",
-            key="following",
-            value=following_count,
-        ))
+    return username, bio, items
 
-    if answer_count := data.get("answer_count"):
-        items.append(ScrapedItem(
-            category="stats",
-            key="answers",
-            value=answer_count,
-        ))
 
-    if articles_count := data.get("articles_count"):
-        items.append(ScrapedItem(
-            category="stats",
-            key="articles",
-            value=articles_count,
-        ))
+# (username, bio, items, raw payload) from either the API or the page.
+_ParsedPage = tuple[str | None, str | None, list[ScrapedItem], dict[str, Any]]
 
-    if question_count := data.get("question_count"):
-        items.append(ScrapedItem(
-            category="stats",
-            key="questions",
-            value=question_count,
-        ))
-
-    if voteup_count := data.get("voteup_count"):
-        items.append(ScrapedItem(
-            category="stats",
-            key="total_upvotes",
-            value=voteup_count,
-        ))
 
-    return username, bio, items
+def _has_user(result: _ParsedPage | None) -> bool:
+    return result is not None and bool(result[0])
 
 
 def _parse_html_embedded_data(html: str) -> dict[str, Any] | None:
     """Extract embedded JSON data from Zhihu profile page HTML."""
-    match = re.search(
-        r'<script id="js-initialData" type="text/json">(.+?)</script>',
-        html,
-        re.DOTALL,
-    )
-    if match:
-        try:
-            return json.loads(match.group(1))
-        except json.JSONDecodeError:
-            pass
-    return None
+    start = html.find(_EMBEDDED_DATA_OPEN)
+    if start == -1:
+        return None
+    start += len(_EMBEDDED_DATA_OPEN)
+    end = html.find("</script>", start)
+    if end <= start:
+        return None
+    try:
+        return loads_json(html[start:end])
+    except ValueError:
+        return None
 
 
 class ZhihuScraper(BaseScraper):
     """Scraper for Zhihu user profiles."""
 
     url_patterns: list[str] = ["*zhihu.com/*"]
+    hosts: tuple[str, ...] = ("zhihu.com",)
 
     def get_platform_name(self) -> str:
         return "Zhihu"
@@ -140,87 +155,37 @@ class ZhihuScraper(BaseScraper):
         bio: str | None = None
         raw: dict[str, Any] = {}
 
-        async with httpx.AsyncClient(
-            timeout=config.timeout, follow_redirects=True,
-        ) as client:
-            # Try API first
-            api_success = False
-            try:
-                include_params = (
-                    "locations,employments,gender,educations,business,"
-                    "voteup_count,thanked_Count,follower_count,following_count,"
-                    "cover_url,following_topic_count,following_question_count,"
-                    "following_favlists_count,following_columns_count,"
-                    "answer_count,articles_count,pins_count,question_count,"
-                    "columns_count,commercial_question_count,favorite_count,"
-                    "favorited_count,logs_count,marked_answers_count,"
-                    "marked_answers_text,message_thread_token,account_status,"
-                    "is_active,is_force_renamed,is_bind_sina,sina_weibo_url,"
-                    "sina_weibo_name,show_sina_weibo,is_blocking,is_blocked,"
-                    "is_following,is_followed,mutual_followees_count,"
-                    "vote_to_count,vote_from_count,thank_to_count,"
-                    "thank_from_count,thanked_count,description,hosted_live_count,"
-                    "participated_live_count,allow_message,industry_category,"
-                    "org_name,org_homepage,badge[?(type=best_answerer)].topics"
-                )
-                api_url = f"https://www.zhihu.com/api/v4/members/{url_token}"
-                resp = await client.get(
-                    api_url,
-                    headers=_ZHIHU_HEADERS,
-                    params={"include": include_params},
-                )
-                resp.raise_for_status()
-                api_data = resp.json()
-
-                if "error" not in api_data:
-                    username, bio, api_items = _parse_api_response(api_data)
-                    items.extend(api_items)
-                    raw["api"] = api_data
-                    api_success = True
-
-                    # Extract topics if available
-                    if badge_list := api_data.get("badge"):
-                        for badge in badge_list[:config.max_items]:
-                            if badge.get("type") == "best_answerer":
-                                for topic in badge.get("topics", []):
-                                    topic_name = topic.get("name")
-                                    topic_url = topic.get("url")
-                                    if topic_name:
-                                        items.append(ScrapedItem(
-                                            category="topic",
-                                            key=topic_name,
-                                            value=topic.get("id"),
-                                            url=topic_url,
-                                        ))
-            except Exception as exc:  # noqa: BLE001
-                logger.debug("Zhihu API failed: %s", exc)
-
-            # Fallback: try HTML scraping
-            if not api_success:
-                try:
-                    profile_url = f"https://www.zhihu.com/people/{url_token}"
-                    resp = await client.get(
-                        profile_url,
-                        headers={
-                            "User-Agent": _ZHIHU_HEADERS["User-Agent"],
-                            "Accept": "text/html",
-                        },
+        async with client_for(config) as client:
+            # API first; if it is slow or fails, race the HTML page against it.
+            api_task = asyncio.create_task(
+                self._try_api(client, url_token, config.timeout, config.max_items)
+            )
+            html_task: asyncio.Task[_ParsedPage | None] | None = None
+            done, _ = await asyncio.wait(
+                {api_task}, timeout=min(_HEDGE_DELAY, config.timeout / 2),
+            )
+            if not done or api_task.result() is None:
+                html_task = asyncio.create_task(self._try_html(client, url_token, config.timeout))
+                pending = {t for t in (api_task, html_task) if not t.done()}
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED,
                     )
-                    resp.raise_for_status()
-                    html = resp.text
-
-                    embedded_data = _parse_html_embedded_data(html)
-                    if embedded_data:
-                        raw["html_embedded"] = embedded_data
-                        # Try to extract user data from embedded JSON
-                        entities = embedded_data.get("initialState", {}).get("entities", {})
-                        users = entities.get("users", {})
-                        if url_token in users:
-                            user_data = users[url_token]
-                            username, bio, html_items = _parse_api_response(user_data)
-                            items.extend(html_items)
-                except Exception as exc:  # noqa: BLE001
-                    logger.debug("Zhihu HTML scraping failed: %s", exc)
+                    if (api_task.done() and api_task.result() is not None) or (
+                        html_task.done() and _has_user(html_task.result())
+                    ):
+                        break
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            # The API result wins whenever it arrived; the page is the fallback.
+            if not api_task.cancelled() and (api_result := api_task.result()):
+                username, bio, items, raw["api"] = api_result
+            elif html_task is not None and not html_task.cancelled() and (
+                html_result := html_task.result()
+            ):
+                username, bio, items, raw["html_embedded"] = html_result
 
         # If we still don't have a username, use the URL token
         if not username:
@@ -235,3 +200,64 @@ class ZhihuScraper(BaseScraper):
             source_url=url,
         )
 
+    # ------------------------------------------------------------------
+    # Fetch attempts (each logs its failure and returns None)
+    # ------------------------------------------------------------------
+
+    async def _try_api(
+        self, client: httpx.AsyncClient, url_token: str, timeout: float,
+        max_items: int,
+    ) -> _ParsedPage | None:
+        try:
+            resp = await client.get(
+                f"https://www.zhihu.com/api/v4/members/{url_token}",
+                headers=_ZHIHU_HEADERS,
+                params=_ZHIHU_API_PARAMS,
+                timeout=timeout,
+            )
+            resp.raise_for_status()
+            api_data = parse_json(resp)
+            if "error" in api_data:
+                return None
+
+            username, bio, items = _parse_api_response(api_data)
+            # Extract topics if available
+            for badge in (api_data.get("badge") or [])[:max_items]:
+                if badge.get("type") == "best_answerer":
+                    for topic in badge.get("topics", []):
+                        if topic_name := topic.get("name"):
+                            items.append(ScrapedItem(
+                                category="topic",
+                                key=topic_name,
+                                value=topic.get("id"),
+                                url=topic.get("url"),
+                            ))
+            return username, bio, items, api_data
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Zhihu API failed: %s", exc)
+            return None
+
+    async def _try_html(
+        self, client: httpx.AsyncClient, url_token: str, timeout: float,
+    ) -> _ParsedPage | None:
+        try:
+            resp = await client.get(
+                f"https://www.zhihu.com/people/{url_token}",
+                headers=_ZHIHU_HTML_HEADERS,
+                timeout=timeout,
+            )
+            resp.raise_for_status()
+            embedded_data = _parse_html_embedded_data(resp.text)
+            if not embedded_data:
+                return None
+
+            # Try to extract user data from embedded JSON
+            entities = embedded_data.get("initialState", {}).get("entities", {})
+            user_data = entities.get("users", {}).get(url_token)
+            if user_data is None:
+                return None, None, [], embedded_data
+            username, bio, items = _parse_api_response(user_data)
+            return username, bio, items, embedded_data
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Zhihu HTML scraping failed: %s", exc)
+            return None
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup
+    from json import loads as _json_loads
+
+if TYPE_CHECKING:
+    from whoami.models import ScraperConfig
+
 _DEFAULT_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -15,6 +29,125 @@ _DEFAULT_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/json",
     "Accept-Language": "en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7",
 }
+_JSON_HEADERS = {**_DEFAULT_HEADERS, "Accept": "application/json"}
+
+
+def new_client(timeout: float = 30.0) -> httpx.AsyncClient:
+    """Create a pooled client suitable for sharing across scrapers."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=timeout,
+        follow_redirects=True,
+        # Idle connections are kept for a minute (httpx defaults to 5 s), so
+        # scrapes queued behind the concurrency caps still find them open.
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0,
+        ),
+    )
+
+
+_shared_client: httpx.AsyncClient | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use.
+
+    Must be called from a running event loop; a client left over from a
+    previous ``asyncio.run()`` is replaced, since its connections are tied
+    to that loop. Callers pass their own per-request ``timeout``.
+    """
+    global _shared_client, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = new_client()
+        _shared_loop = loop
+    return _shared_client
+
+
+async def close_client() -> None:
+    """Close the process-wide client, if one was created."""
+    global _shared_client, _shared_loop
+    client, _shared_client, _shared_loop = _shared_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+# Successful JSON bodies are kept briefly so repeated scrapes of the same
+# profile (interactive sessions, retries) skip the network. Bodies are
+# stored undecoded, so every caller gets its own freshly parsed object.
+# Keys are digests, so tokens in headers or params are never held, and
+# only requests made through the process-wide client are cached: an
+# injected client (tests, custom transports) always hits its transport.
+_JSON_CACHE_TTL = 300.0
+_JSON_CACHE_MAXSIZE = 1024
+_JSON_CACHE_MAXBYTES = 16 * 1024 * 1024
+_json_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_json_cache_bytes = 0
+
+
+def _json_cache_key(
+    url: str, headers: dict[str, str], params: dict[str, Any] | None,
+) -> str:
+    digest = hashlib.sha256(url.encode())
+    for part in (headers, params or {}):
+        digest.update(b"\x00")
+        digest.update(repr(sorted((str(k), repr(v)) for k, v in part.items())).encode())
+    return digest.hexdigest()
+
+
+def _json_cache_pop(key: str) -> None:
+    global _json_cache_bytes
+    _expires, body = _json_cache.pop(key)
+    _json_cache_bytes -= len(body)
+
+
+def _json_cache_put(key: str, expires: float, body: bytes) -> None:
+    global _json_cache_bytes
+    if len(body) > _JSON_CACHE_MAXBYTES // 8:  # too big to be worth pinning
+        return
+    if key in _json_cache:
+        _json_cache_pop(key)
+    _json_cache[key] = (expires, body)
+    _json_cache_bytes += len(body)
+    while len(_json_cache) > _JSON_CACHE_MAXSIZE or _json_cache_bytes > _JSON_CACHE_MAXBYTES:
+        _json_cache_pop(next(iter(_json_cache)))
+
+
+def clear_json_cache() -> None:
+    """Forget all cached ``fetch_json`` responses."""
+    global _json_cache_bytes
+    _json_cache.clear()
+    _json_cache_bytes = 0
+
+
+def loads_json(data: str | bytes) -> Any:
+    """Decode JSON text, with orjson when it is installed.
+
+    Raises ``ValueError`` on malformed JSON.
+    """
+    return _json_loads(data)
+
+
+def parse_json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed.
+
+    Raises ``ValueError`` on malformed JSON, like ``resp.json()``.
+    """
+    return _json_loads(resp.content)
+
+
+@asynccontextmanager
+async def _borrow(
+    client: httpx.AsyncClient | None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield *client*, or the process-wide client; neither is closed on exit."""
+    yield client if client is not None else get_client()
+
+
+def client_for(config: ScraperConfig) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Borrow ``config.extra["http_client"]`` if set, else the process-wide client."""
+    return _borrow(config.extra.get("http_client"))
 
 
 async def fetch_json(
@@ -23,12 +156,41 @@ async def fetch_json(
     headers: dict[str, str] | None = None,
     params: dict[str, Any] | None = None,
     timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
 ) -> dict[str, Any]:
-    merged = {**_DEFAULT_HEADERS, **{"Accept": "application/json"}, **(headers or {})}
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        resp = await client.get(url, headers=merged, params=params)
-        resp.raise_for_status()
-        return resp.json()
+    merged = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
+    c = client if client is not None else get_client()
+    key = _json_cache_key(url, merged, params) if c is _shared_client else None
+    now = time.monotonic()
+    if key is not None and (hit := _json_cache.get(key)) is not None:
+        expires, body = hit
+        if expires > now:
+            _json_cache.move_to_end(key)
+            return _json_loads(body)
+        _json_cache_pop(key)
+
+    resp = await c.get(url, headers=merged, params=params, timeout=timeout)
+    resp.raise_for_status()
+    data = parse_json(resp)
+    if key is not None:
+        _json_cache_put(key, now + _JSON_CACHE_TTL, resp.content)
+    return data
+
+
+async def post_json(
+    url: str,
+    *,
+    json: Any,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
+) -> Any:
+    """POST a JSON body and decode the JSON reply; replies are never cached."""
+    merged = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
+    c = client if client is not None else get_client()
+    resp = await c.post(url, headers=merged, json=json, timeout=timeout)
+    resp.raise_for_status()
+    return parse_json(resp)
 
 
 async def fetch_text(
@@ -36,9 +198,44 @@ async def fetch_text(
     *,
     headers: dict[str, str] | None = None,
     timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
 ) -> str:
-    merged = {**_DEFAULT_HEADERS, **(headers or {})}
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        resp = await client.get(url, headers=merged)
+    merged = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
+    c = client if client is not None else get_client()
+    resp = await c.get(url, headers=merged, timeout=timeout)
+    resp.raise_for_status()
+    return resp.text
+
+
+async def fetch_bytes(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
+) -> bytes:
+    """GET *url* and return the undecoded body."""
+    merged = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
+    c = client if client is not None else get_client()
+    resp = await c.get(url, headers=merged, timeout=timeout)
+    resp.raise_for_status()
+    return resp.content
+
+
+@asynccontextmanager
+async def fetch_stream(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float = 30.0,
+    client: httpx.AsyncClient | None = None,
+) -> AsyncIterator[httpx.Response]:
+    """GET *url* without reading the body; iterate it with ``resp.aiter_bytes()``.
+
+    Leaving the block early drops the rest of the body.
+    """
+    merged = {**_DEFAULT_HEADERS, **headers} if headers else _DEFAULT_HEADERS
+    c = client if client is not None else get_client()
+    async with c.stream("GET", url, headers=merged, timeout=timeout) as resp:
         resp.raise_for_status()
-        return resp.text
+        yield resp
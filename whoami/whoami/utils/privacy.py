@@ -11,9 +11,17 @@ _PATTERNS: list[tuple[str, re.Pattern[str]]] = [
     ("ip_address", re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b")),
 ]
 
+# Every pattern needs an "@" or a digit; text without either is left alone.
+_TRIGGER_RE: re.Pattern[str] = re.compile(r"[@\d]")
+
 
 def strip_sensitive(text: str) -> str:
     """Remove emails, phone numbers, ID card numbers, and IPs from text."""
+    if not _TRIGGER_RE.search(text):
+        return text
+    # Patterns run one after another, not as one alternation: an earlier
+    # redaction (e.g. an email) must be able to pre-empt an overlapping
+    # later match (e.g. a phone number ending at the "@").
     for _name, pattern in _PATTERNS:
         text = pattern.sub("[REDACTED]", text)
     return text
@@ -0,0 +1,16 @@
+"""URL helpers shared by the router and scrapers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse
+
+
+@lru_cache(maxsize=1024)
+def parse_url(url: str) -> ParseResult:
+    """``urlparse`` *url*, assuming ``https://`` when it has no scheme.
+
+    Cached: the router and the scraper handling a URL parse the same
+    string, so each URL is only parsed once.
+    """
+    return urlparse(url if "://" in url else f"https://{url}")